@@ -1,2 +1,4 @@
-from .move import MoveBuilder
-from .arbiter import HerbArbiter, ActionContext
+from .opcodes import ACTIONS, BITE, DIVIDE, MOVE
+from .arbiter import HerbArbiter
+from .bulk import BULK_MIN_CELLS, BulkArbiter
+from .step_context import StepContext
@@ -3,39 +3,9 @@ from abc import ABC, abstractmethod
 from typing import Tuple
 
 from cells import BaseCell
-from action.arbiter_handler import StartMove, Move, EatHerbFood, Reproduction
-
-
-class ActionContext:
-    """Контекст для стратегий взаимодействия с миром."""
-
-    _strategy: "Arbiter" = None
-
-    def set_strategy(self, strategy: "Arbiter") -> None:
-        """Метод для установки стратегии.
-
-        Args:
-            strategy (Arbiter): Объект наследник класса Arbiter который будет установлен в качестве стратегии в контекст
-            исполнения.
-        """
-        self._strategy = strategy
-
-    def execute(
-        self,
-        cell: BaseCell,
-        coordinates: Tuple[int, int],
-        old_map: Tuple[Tuple[BaseCell]],
-        new_map: Tuple[Tuple[BaseCell]],
-    ):
-        """Метод для исполнения метода стратегии.
-
-        Args:
-            cell (BaseCell): Ячейка к которой будет применяться стратегия
-            coordinates: Tuple[int, int]: Координаты текущего местоположения клетки
-            old_map (Tuple[Tuple[BaseCell]]): Старое матриченое представление карты
-            new_map (TupleTuple[Tuple[BaseCell]]): Новое матричное представление карты
-        """
-        self._strategy.cell_move(cell, coordinates, old_map, new_map)
+from action.arbiter_handler import DISPATCH, Grid, die
+from action.opcodes import ACTIONS
+from action.step_context import StepContext
 
 
 class Arbiter(ABC):
@@ -55,43 +25,42 @@ class Arbiter(ABC):
         self,
         cell: BaseCell,
         coordinates: Tuple[int, int],
-        old_map: Tuple[Tuple[BaseCell]],
-        new_map: Tuple[Tuple[BaseCell]],
+        old_map: Grid,
+        new_map: Grid,
+        step: StepContext,
     ):
         """Метод отвечающий за логику перемещения клетки в мире.
 
         Args:
             cell (BaseCell): Ячейка к которой будет применяться стратегия
             coordinates: Tuple[int, int]: Координаты текущего местоположения клетки
-            old_map (Tuple[Tuple[BaseCell]]): Старое матриченое представление карты
-            new_map (Tuple[Tuple[BaseCell]]): Новое матричное представление карты
+            old_map (Grid): Старое матриченое представление карты
+            new_map (Grid): Новое матричное представление карты
+            step (StepContext): Состояние текущего шага, куда записываются изменения мира
         """
         pass
 
 
 class HerbArbiter(Arbiter):
-    """Класс стратегия, отвечающий за движение травоядных клеток в мире."""
+    """Класс стратегия, отвечающий за движение травоядных клеток в мире.
+
+    Действие клетки - индекс выходного нейрона, он переводится в код операции и смещение по таблице ACTIONS, а
+    обработчик операции выбирается по таблице DISPATCH.
+    """
 
     def cell_move(
         self,
         cell: BaseCell,
         coordinates: Tuple[int, int],
-        old_map: Tuple[Tuple[BaseCell]],
-        new_map: Tuple[Tuple[BaseCell]],
+        old_map: Grid,
+        new_map: Grid,
+        step: StepContext,
     ):
-        start = StartMove()
-        move = Move()
-        eat = EatHerbFood()
-        reproduction = Reproduction()
-
-        start.set_next(move)
-        move.set_next(eat)
-        eat.set_next(reproduction)
-
-        can_processing = start.handle(cell, coordinates, old_map, new_map)
-
-        if not can_processing:
-            x, y = coordinates
-            new_map[y][x] = cell
-
-        cell.reset_move_info()
+        x, y = coordinates
+        # в начале проверяется жива ли клетка, умершая клетка не совершает действие
+        if cell.is_dead:
+            die(cell, x, y, old_map, new_map, step)
+            return
+
+        opcode, x_delta, y_delta = ACTIONS[cell.ACTION]
+        DISPATCH[opcode](cell, x, y, x_delta, y_delta, old_map, new_map, step)
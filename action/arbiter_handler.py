@@ -1,234 +1,141 @@
-from abc import ABC, abstractmethod
-
-from typing import Tuple
-
-from cells import Empty, BaseCell, PlantFood
-
-
-class Handler(ABC):
-    """Абстрактный класс для цепочки обработчиков для арбитера."""
-
-    _next: "Handler" = None
-
-    def __new__(cls):
-        if not hasattr(cls, "instance"):
-            cls.instance = super().__new__(cls)
-        return cls.instance
-
-    @abstractmethod
-    def handle(
-        self,
-        cell: BaseCell,
-        coordinates: Tuple[int, int],
-        old_map: Tuple[Tuple[BaseCell]],
-        new_map: Tuple[Tuple[BaseCell]],
-    ) -> bool:
-        """Метод для обработки вызова цепочки звена.
-
-        Args:
-            cell (BaseCell): ячейка которая совершает движение
-            coordinates (Tuple[int, int]): координаты положения ячейки на карте
-            old_map (Tuple[Tuple[BaseCell]]): старое представление карты
-            new_map (Tuple[Tuple[BaseCell]]): новое представление карты
-
-        Returns:
-            bool: True - если хоть какое то звено цепи обработало вызов, False если никто не обработал вызов.
-        """
-        pass
-
-    def set_next(self, next_link: "Handler") -> "Handler":
-        """Метод для установки следующей цепочки звена.
-
-        Returns:
-            next_link (Handler): Следующее звено цепочки вызовов.
-        """
-        self._next = next_link
-        return self
-
-    @staticmethod
-    def _action_coordinates(
-        coordinates: Tuple[int, int], move_delta: Tuple[int, int], map_size: Tuple[int, int]
-    ) -> Tuple[int, int]:
-        """Метод производит расчет координат ячейки, с которыми клетка должна произвести взаимодействие.
-
-        Args:
-            coordinates (Tuple[int, int]): Текущее положение клетки (x, y)
-            move_delta (Tuple[int, int]): Дельта смещения (d_x, d_y)
-            map_size (Tuple[int, int]): Размеры карты (ширина, высотка)
-
-        Returns:
-            Tuple[int, int]: Ячейка с которой клетка должно совершить взаимодействие (переместиться или
-             съесть или тп)
-        """
-        x, y = coordinates
-        x_delta, y_delta = move_delta
-        map_width, map_height = map_size
-
-        i = x + x_delta  # высчитывается новая координата положения
-        j = y + y_delta
-
-        # выставляем положение с другого конца (мир замкнут по кругу)
-        if i >= map_width:
-            i -= map_width
-        if i < 0:
-            i += map_width
-
-        if j >= map_height:
-            j -= map_height
-        if j < 0:
-            j += map_height
-
-        return i, j
-
-
-class StartMove(Handler):
-    """Звено обработки начало движение клетки, в начале проверяется жива ли клетка чтобы начать действие."""
-
-    def handle(
-        self,
-        cell: BaseCell,
-        coordinates: Tuple[int, int],
-        old_map: Tuple[Tuple[BaseCell]],
-        new_map: Tuple[Tuple[BaseCell]],
-    ):
-        x, y = coordinates
-        result = False
-
-        if cell.is_dead:
-            food = PlantFood().set_id(cell.get_id)
-            new_map[y][x] = food
-            return True
-
-        if self._next is not None:
-            result = self._next.handle(cell, coordinates, old_map, new_map)
-        return result
-
-
-class Move(Handler):
-    """Звено обрабатывающее движение клетки."""
-
-    def handle(
-        self,
-        cell: BaseCell,
-        coordinates: Tuple[int, int],
-        old_map: Tuple[Tuple[BaseCell]],
-        new_map: Tuple[Tuple[BaseCell]],
-    ):
-        move = cell.get_move_info().get_move()
-        result = False
-
-        if move is not None:
-            x, y = coordinates
-            map_width = len(old_map[0])
-            map_height = len(old_map)
-
-            i, j = self._action_coordinates([x, y], move, [map_width, map_height])
-
-            # возможность прохода на клетку проверяется по старой карте
-            new_position_cell = old_map[j][i]
-            if not new_position_cell.is_solid:
-                # если клетка может сделать шаг, то в старой карте она блокирует позициую куда собирается встать на
-                # новой итерации, а свое перемещение она фиксирует на новой карте. заблокированная ячейка в
-                # старой карте не даст двум клеткам встать в одно и тоже место и при этом не вызывает бага с тем
-                # что ячейка воздуха становится непроницаемой
-                new_position_cell.busy()
-                new_map[y][x] = Empty().set_id(cell.get_id)
-                new_map[j][i] = cell.set_id(new_position_cell.get_id)
-            else:
-                # если клетка заблокирована, куда нужно сделать шаг, то все равно нужно обновить состояние объекта
-                # на новой карте объект, пусть он и остался на месте
-                new_map[y][x] = cell
-            return True
-
-        if move is None and self._next is not None:
-            result = self._next.handle(cell, coordinates, old_map, new_map)
-
-        return result
-
-
-class EatHerbFood(Handler):
-    """Звено обрабатывающее укус травоядной клетки."""
-
-    def handle(
-        self,
-        cell: BaseCell,
-        coordinates: Tuple[int, int],
-        old_map: Tuple[Tuple[BaseCell]],
-        new_map: Tuple[Tuple[BaseCell]],
-    ):
-        bite = cell.get_move_info().get_bite()
-        result = False
-
-        if bite is not None:
-            x, y = coordinates
-            map_width = len(old_map[0])
-            map_height = len(old_map)
-
-            i, j = self._action_coordinates([x, y], bite, [map_width, map_height])
-
-            target_cell = old_map[j][i]
-            if isinstance(target_cell, PlantFood) and target_cell.can_eat:
-                target_cell.eat()
-                cell.got_food()
-                new_map[j][i] = Empty().set_id(target_cell.get_id)
-            new_map[y][x] = cell
-            return True
-
-        if bite is None and self._next is not None:
-            result = self._next.handle(cell, coordinates, old_map, new_map)
-
-        return result
-
-
-class Reproduction(Handler):
-    """Звено для размножения клеток."""
-
-    def handle(
-        self,
-        cell: BaseCell,
-        coordinates: Tuple[int, int],
-        old_map: Tuple[Tuple[BaseCell]],
-        new_map: Tuple[Tuple[BaseCell]],
-    ):
-        is_reproduction = cell.get_move_info().is_reproduction()
-        result = False
-
-        if is_reproduction and cell.can_reproduction:
-            x, y = coordinates
-            map_width = len(old_map[0])
-            map_height = len(old_map)
-
-            cell_clone_position = old_map[y][x]
-
-            x_delta = y_delta = -1
-
-            # если клетка может размножаться, проверяем есть ле место, где может расположиться копия
-            while cell_clone_position.is_solid:
-                i, j = self._action_coordinates([x, y], [x_delta, y_delta], [map_width, map_height])
-                cell_clone_position = old_map[j][i]
-
-                if y_delta < 1:
-                    y_delta += 1
-
-                if y_delta == 1:
-                    x_delta += 1
-
-                if x_delta == 2:
-                    # если x_delta > 1 и y_delta == 1, получается свободного места рядом с клеткой нет, но обработать
-                    # данное звено смогло, значит просто завершаем обработку
-                    x, y = coordinates
-                    new_map[y][x] = cell
-                    return True
-
-            # если есть место где располагать новую клетку, начинается процесс репродукции
-            cell_clone = cell.reprodaction()
-            cell_clone.set_id(cell_clone_position.get_id)
-            cell_clone_position.busy()
-            new_map[y][x] = cell
-            new_map[j][i] = cell_clone
-            return True
-
-        if self._next is not None:
-            result = self._next.handle(cell, coordinates, old_map, new_map)
-
-        return result
+"""Обработчики действий клеток арбитера.
+
+Каждый обработчик выполняет одну операцию из action.opcodes и имеет одинаковую сигнатуру, поэтому арбитер вызывает
+нужный обработчик по коду операции из таблицы DISPATCH, без цепочки звеньев и промежуточных объектов.
+"""
+from typing import Callable, List, Tuple
+
+from action.opcodes import BITE, DIVIDE, MOVE
+from action.step_context import StepContext
+from cells import EMPTY, PLANT_FOOD, BaseCell, PlantFood
+
+Grid = List[List[BaseCell]]
+Handler = Callable[[BaseCell, int, int, int, int, Grid, Grid, StepContext], None]
+
+# смещения (d_x, d_y) соседних ячеек в порядке обхода мира, начиная с левого верхнего угла
+NEIGHBOURS = ((-1, -1), (0, -1), (1, -1), (-1, 0), (1, 0), (-1, 1), (0, 1), (1, 1))
+
+
+def action_coordinates(x: int, y: int, x_delta: int, y_delta: int, old_map: Grid) -> Tuple[int, int]:
+    """Функция производит расчет координат ячейки, с которыми клетка должна произвести взаимодействие.
+
+    Мир замкнут по кругу, поэтому координаты за краем карты переносятся на другой ее конец.
+
+    Args:
+        x (int): Текущее положение клетки по оси x
+        y (int): Текущее положение клетки по оси y
+        x_delta (int): Смещение по оси x
+        y_delta (int): Смещение по оси y
+        old_map (Grid): Карта мира, строки которой не принадлежащие тайлу могут быть None
+
+    Returns:
+        Tuple[int, int]: Ячейка (x, y), с которой клетка должна совершить взаимодействие.
+    """
+    return (x + x_delta) % len(old_map[y]), (y + y_delta) % len(old_map)
+
+
+def die(cell: BaseCell, x: int, y: int, old_map: Grid, new_map: Grid, step: StepContext) -> None:
+    """Обработчик смерти клетки: на месте умершей клетки появляется растительная пища.
+
+    Args:
+        cell (BaseCell): Умершая клетка
+        x (int): Положение клетки по оси x
+        y (int): Положение клетки по оси y
+        old_map (Grid): Старое представление карты
+        new_map (Grid): Новое представление карты
+        step (StepContext): Состояние текущего шага, куда записываются изменения мира
+    """
+    new_map[y][x] = PLANT_FOOD
+    step.mark_dirty(x, y)
+    step.deaths += 1
+
+
+def move(
+    cell: BaseCell, x: int, y: int, x_delta: int, y_delta: int, old_map: Grid, new_map: Grid, step: StepContext
+) -> None:
+    """Обработчик шага клетки.
+
+    Args:
+        cell (BaseCell): Клетка, которая совершает действие
+        x (int): Положение клетки по оси x
+        y (int): Положение клетки по оси y
+        x_delta (int): Смещение по оси x
+        y_delta (int): Смещение по оси y
+        old_map (Grid): Старое представление карты
+        new_map (Grid): Новое представление карты
+        step (StepContext): Состояние текущего шага, куда записываются изменения мира
+    """
+    i, j = action_coordinates(x, y, x_delta, y_delta, old_map)
+
+    if j in step.halo:
+        # ячейка принадлежит соседнему тайлу, шаг разрешит его владелец, а до тех пор клетка стоит на месте
+        step.defer(MOVE, cell, (x, y), [(i, j)])
+        new_map[y][x] = cell
+    # возможность прохода на клетку проверяется по индексу свободных ячеек на начало шага
+    elif step.is_free(i, j):
+        # если клетка может сделать шаг, то она занимает позицию в индексе свободных ячеек, а свое перемещение
+        # фиксирует на новой карте. занятая ячейка не даст двум клеткам встать в одно и тоже место, а
+        # освободившаяся ячейка станет доступна только на следующем шаге
+        step.occupy(i, j)
+        new_map[y][x] = EMPTY
+        new_map[j][i] = cell
+        step.mark_dirty(x, y)
+        step.mark_dirty(i, j)
+        step.moves += 1
+    else:
+        # если клетка заблокирована, куда нужно сделать шаг, то все равно нужно обновить состояние объекта на новой
+        # карте объект, пусть он и остался на месте
+        new_map[y][x] = cell
+
+
+def bite(
+    cell: BaseCell, x: int, y: int, x_delta: int, y_delta: int, old_map: Grid, new_map: Grid, step: StepContext
+) -> None:
+    """Обработчик укуса травоядной клетки, аргументы как у move."""
+    i, j = action_coordinates(x, y, x_delta, y_delta, old_map)
+
+    if j in step.halo:
+        step.defer(BITE, cell, (x, y), [(i, j)])
+    else:
+        # пища не съедена в этом шаге, пока на новой карте на ее месте не появилась пустая ячейка
+        target_cell = old_map[j][i]
+        if isinstance(target_cell, PlantFood) and new_map[j][i] is target_cell:
+            cell.got_food(step.config.food_energy)
+            new_map[j][i] = EMPTY
+            step.mark_dirty(i, j)
+            step.bites += 1
+    new_map[y][x] = cell
+
+
+def divide(
+    cell: BaseCell, x: int, y: int, x_delta: int, y_delta: int, old_map: Grid, new_map: Grid, step: StepContext
+) -> None:
+    """Обработчик деления клетки, аргументы как у move, смещение не используется."""
+    new_map[y][x] = cell
+    if not cell.can_reproduction:
+        return
+
+    # если клетка может размножаться, проверяем есть ли рядом место, где может расположиться копия
+    remote = []  # соседние ячейки, которые принадлежат соседнему тайлу
+    for neighbour_x, neighbour_y in NEIGHBOURS:
+        i, j = action_coordinates(x, y, neighbour_x, neighbour_y, old_map)
+        if j in step.halo:
+            remote.append((i, j))
+        elif step.is_free(i, j):
+            break
+    else:
+        # свободного места рядом с клеткой нет. если часть соседей принадлежит соседнему тайлу, место среди них
+        # найдет его владелец
+        if remote:
+            step.defer(DIVIDE, cell, (x, y), remote)
+        return
+
+    # если есть место где располагать новую клетку, начинается процесс репродукции
+    step.occupy(i, j)
+    new_map[j][i] = cell.reprodaction()
+    step.mark_dirty(i, j)
+    step.divisions += 1
+
+
+# код операции -> обработчик, индекс обработчика равен коду его операции
+DISPATCH: Tuple[Handler, ...] = (move, bite, divide)
@@ -0,0 +1,165 @@
+from typing import Dict, List
+
+import numpy as np
+
+from action.arbiter_handler import NEIGHBOURS, Grid
+from action.opcodes import ACTIONS, BITE, DIVIDE, MOVE
+from action.step_context import StepContext
+from cells import EMPTY, PLANT_FOOD, Empty, PlantFood
+from cells.live.base import BaseLive
+from lib.world_state import WorldState
+
+# таблица действий в виде массивов, индекс - действие клетки
+OPCODES = np.array([opcode for opcode, _, _ in ACTIONS], dtype=np.int8)
+X_DELTAS = np.array([x_delta for _, x_delta, _ in ACTIONS], dtype=np.intp)
+Y_DELTAS = np.array([y_delta for _, _, y_delta in ACTIONS], dtype=np.intp)
+
+# число живых клеток, начиная с которого арбитер быстрее обхода клеток по одной: на меньших шагах постоянные затраты
+# векторных операций больше выигрыша, по замерам python -m benchmarks.arbiter перелом между 128 и 256 клетками
+BULK_MIN_CELLS = 256
+
+
+def _first_claims(order: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    """Функция возвращает для каждой различной цели номер первой претендующей на нее клетки."""
+    _, first = np.unique(targets, return_index=True)
+    return order[first]
+
+
+class BulkArbiter:
+    """Арбитер, разрешающий действия всех клеток шага сразу.
+
+    Цели всех действий вычисляются одной векторной операцией по массиву действий клеток, конфликты разрешаются по тому
+    же правилу, что и при обходе клеток по одной: клетки упорядочены построчно, и ячейку получает клетка, которая
+    раньше других на нее претендовала. Шаг и укус разрешаются векторно:
+
+    - укус удается первой клетке, укусившей пищу;
+    - шаг удается первой клетке, шагнувшей в свободную ячейку, если раньше нее эту ячейку не занял ребенок.
+
+    Деление зависит от того, какие соседние ячейки уже заняты, поэтому делящиеся клетки, которых обычно немного,
+    обходятся по порядку: ребенок встает в первую по обходу соседей ячейку, которая свободна, не занята ребенком более
+    ранней клетки и в которую не шагнула более ранняя клетка. После разрешения все изменения применяются к новой карте
+    за один проход.
+
+    Арбитер не поддерживает строки соседних тайлов, поэтому тайлы разрешают действия по одной клетке. По умолчанию мир
+    пользуется арбитером только на шагах, где живых клеток не меньше BULK_MIN_CELLS.
+    """
+
+    __slots__ = ()
+
+    def resolve(
+        self,
+        cells: List[BaseLive],
+        rows: np.ndarray,
+        cols: np.ndarray,
+        actions: List[int],
+        new_map: Grid,
+        state: WorldState,
+        step: StepContext,
+    ) -> None:
+        """Метод разрешает действия всех клеток, действия уже применены к клеткам через apply_move.
+
+        Args:
+            cells (List[BaseLive]): Живые клетки на начало шага, упорядоченные построчно
+            rows (np.ndarray): Расположение клеток по оси y
+            cols (np.ndarray): Расположение клеток по оси x
+            actions (List[int]): Действия клеток, индексы в action.opcodes.ACTIONS
+            new_map (Grid): Новое представление карты, копия карты на начало шага
+            state (WorldState): Представление мира массивами на начало шага
+            step (StepContext): Состояние текущего шага, куда записываются изменения мира
+        """
+        count = len(cells)
+        if not count:
+            return
+
+        height, width = state.types.shape
+        types = state.types.ravel()
+        actions = np.asarray(actions, dtype=np.intp)
+        opcodes = OPCODES[actions]
+        alive = np.array([not cell.is_dead for cell in cells])
+        target_rows = (rows + Y_DELTAS[actions]) % height
+        target_cols = (cols + X_DELTAS[actions]) % width
+        targets = target_rows * width + target_cols
+        order = np.arange(count)
+
+        # укус удается первой клетке, укусившей пищу
+        biters = order[alive & (opcodes == BITE)]
+        biters = biters[types[targets[biters]] == PlantFood.CODE]
+        biters = np.sort(_first_claims(biters, targets[biters]))
+
+        # ячейка свободна, если на начало шага в ней пустота. для каждой такой ячейки запоминается первая клетка,
+        # которая в нее шагнула
+        movers = order[alive & (opcodes == MOVE)]
+        movers = movers[types[targets[movers]] == Empty.CODE]
+        movers = _first_claims(movers, targets[movers])
+        first_mover: Dict[int, int] = dict(zip(targets[movers].tolist(), movers.tolist()))
+
+        children: Dict[int, int] = {}  # ячейка -> номер клетки, ребенок которой в нее встал
+        for k in order[alive & (opcodes == DIVIDE)].tolist():
+            if not cells[k].can_reproduction:
+                continue
+            y, x = int(rows[k]), int(cols[k])
+            for x_delta, y_delta in NEIGHBOURS:
+                target = (y + y_delta) % height * width + (x + x_delta) % width
+                if types[target] == Empty.CODE and target not in children and first_mover.get(target, count) > k:
+                    children[target] = k
+                    break
+
+        if children:
+            # шаг не удается, если в ту же ячейку раньше встал ребенок
+            cells_taken = np.fromiter(children, dtype=np.intp, count=len(children))
+            takers = np.fromiter(children.values(), dtype=np.intp, count=len(children))
+            sort = np.argsort(cells_taken)
+            cells_taken, takers = cells_taken[sort], takers[sort]
+            found = np.minimum(np.searchsorted(cells_taken, targets[movers]), len(cells_taken) - 1)
+            taken = (cells_taken[found] == targets[movers]) & (takers[found] < movers)
+            movers = movers[~taken]
+        movers = np.sort(movers)
+
+        self._apply(cells, rows, cols, target_rows, target_cols, alive, biters, movers, children, width, new_map, step)
+
+    @staticmethod
+    def _apply(
+        cells: List[BaseLive],
+        rows: np.ndarray,
+        cols: np.ndarray,
+        target_rows: np.ndarray,
+        target_cols: np.ndarray,
+        alive: np.ndarray,
+        biters: np.ndarray,
+        movers: np.ndarray,
+        children: Dict[int, int],
+        width: int,
+        new_map: Grid,
+        step: StepContext,
+    ) -> None:
+        """Метод применяет разрешенные действия к новой карте."""
+        rows = rows.tolist()
+        cols = cols.tolist()
+
+        # на месте умершей клетки появляется растительная пища
+        for k in np.flatnonzero(~alive).tolist():
+            new_map[rows[k]][cols[k]] = PLANT_FOOD
+            step.mark_dirty(cols[k], rows[k])
+        step.deaths += int(np.count_nonzero(~alive))
+
+        energy = step.config.food_energy
+        for k, i, j in zip(biters.tolist(), target_cols[biters].tolist(), target_rows[biters].tolist()):
+            cells[k].got_food(energy)
+            new_map[j][i] = EMPTY
+            step.mark_dirty(i, j)
+        step.bites += len(biters)
+
+        for k, i, j in zip(movers.tolist(), target_cols[movers].tolist(), target_rows[movers].tolist()):
+            step.occupy(i, j)
+            new_map[rows[k]][cols[k]] = EMPTY
+            new_map[j][i] = cells[k]
+            step.mark_dirty(cols[k], rows[k])
+            step.mark_dirty(i, j)
+        step.moves += len(movers)
+
+        for target, k in sorted(children.items(), key=lambda item: item[1]):
+            j, i = divmod(target, width)
+            step.occupy(i, j)
+            new_map[j][i] = cells[k].reprodaction()
+            step.mark_dirty(i, j)
+        step.divisions += len(children)
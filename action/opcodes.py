@@ -0,0 +1,25 @@
+"""Целочисленное кодирование действий клеток.
+
+Действие клетки - индекс самого яркого выходного нейрона. Таблица ACTIONS переводит его в код операции и смещение
+(d_x, d_y) ячейки, с которой клетка взаимодействует, а арбитер выбирает обработчик по коду операции из таблицы
+обработчиков, поэтому между нейронной сетью и арбитером не создается промежуточных объектов.
+"""
+from typing import Tuple
+
+# коды операций, они же виды действий, которые затрагивают ячейки соседнего тайла и разрешаются его владельцем
+MOVE = 0
+BITE = 1
+DIVIDE = 2
+
+# индекс выходного нейрона -> (код операции, d_x, d_y)
+ACTIONS: Tuple[Tuple[int, int, int], ...] = (
+    (MOVE, 0, -1),  # шаг вверх
+    (MOVE, 1, 0),  # шаг вправо
+    (MOVE, 0, 1),  # шаг вниз
+    (MOVE, -1, 0),  # шаг влево
+    (BITE, 0, -1),  # укус вверх
+    (BITE, 1, 0),  # укус вправо
+    (BITE, 0, 1),  # укус вниз
+    (BITE, -1, 0),  # укус влево
+    (DIVIDE, 0, 0),  # деление
+)
@@ -0,0 +1,85 @@
+from typing import Dict, FrozenSet, List, Set, Tuple
+
+from lib.config import WorldConfig
+from lib.index import PositionIndex
+
+
+class StepContext:
+    """Состояние текущего шага мира, общее для всех обработчиков арбитера.
+
+    Обработчики арбитера записывают сюда все, что они поменяли в мире, чтобы миру не приходилось искать изменения
+    сравнением старой и новой карты.
+    """
+
+    def __init__(self, free: PositionIndex = None, config: WorldConfig = None, halo: FrozenSet[int] = frozenset()):
+        """
+        Args:
+            free (PositionIndex, optional): Индекс свободных ячеек на начало шага. Ячейки, которые клетки заняли на
+                этом шаге, сразу удаляются из индекса, чтобы две клетки не встали в одно и тоже место.
+                Defaults to None.
+            config (WorldConfig, optional): Параметры мира, по которым обработчики арбитера применяют правила.
+                Defaults to None.
+            halo (FrozenSet[int], optional): Номера строк, которые принадлежат соседним тайлам, если мир разбит на
+                тайлы. Действия с ячейками этих строк не выполняются, а откладываются. Defaults to frozenset().
+        """
+        self.dirty: Set[Tuple[int, int]] = set()  # координаты (y, x) ячеек, изменившихся за шаг
+        self.free = free
+        self.config = config
+        self.halo = halo
+        # отложенные действия (вид, координаты (x, y) клетки, ячейки-цели (x, y) по порядку, клетка)
+        self.deferred: List[tuple] = []
+        # счетчики событий шага, по ним профилировщик мира собирает статистику
+        self.moves = 0
+        self.bites = 0
+        self.divisions = 0
+        self.deaths = 0
+
+    def counters(self) -> Dict[str, int]:
+        """Метод возвращает счетчики событий шага.
+
+        Returns:
+            Dict[str, int]: Число шагов, удачных укусов, делений и смертей клеток за шаг.
+        """
+        return {"moves": self.moves, "bites": self.bites, "divisions": self.divisions, "deaths": self.deaths}
+
+    def defer(self, kind: int, cell, coordinates: Tuple[int, int], targets: List[Tuple[int, int]]) -> None:
+        """Метод откладывает действие клетки с ячейками соседнего тайла, его разрешит владелец этих ячеек.
+
+        Args:
+            kind (int): Вид действия: MOVE, BITE или DIVIDE
+            cell (BaseLive): Клетка, совершающая действие
+            coordinates (Tuple[int, int]): Расположение клетки (x, y)
+            targets (List[Tuple[int, int]]): Ячейки (x, y), с которыми клетка хочет взаимодействовать, для деления -
+                все подходящие ячейки в порядке обхода соседей
+        """
+        self.deferred.append((kind, tuple(coordinates), targets, cell))
+
+    def mark_dirty(self, x: int, y: int) -> None:
+        """Метод отмечает ячейку как изменившуюся на текущем шаге.
+
+        Args:
+            x (int): Расположение ячейки по оси x
+            y (int): Расположение ячейки по оси y
+        """
+        self.dirty.add((y, x))
+
+    def is_free(self, x: int, y: int) -> bool:
+        """Метод проверяет, свободна ли ячейка и не занята ли она другой клеткой на этом шаге.
+
+        Args:
+            x (int): Расположение ячейки по оси x
+            y (int): Расположение ячейки по оси y
+
+        Returns:
+            bool: True - если в ячейку можно встать.
+        """
+        return (y, x) in self.free
+
+    def occupy(self, x: int, y: int) -> None:
+        """Метод занимает свободную ячейку, до конца шага в нее не сможет встать другая клетка.
+
+        Args:
+            x (int): Расположение ячейки по оси x
+            y (int): Расположение ячейки по оси y
+        """
+        self.free.discard((y, x))
@@ -0,0 +1,99 @@
+"""Проверка и бенчмарк арбитеров мира.
+
+Прогоняет мир с фиксированными зернами дважды: с разрешением действий всех клеток сразу (action.bulk.BulkArbiter) и
+с обходом клеток по одной. После каждого шага сравнивает типы ячеек и здоровье клеток, а в конце - историю эпох.
+Печатает время фазы арбитража обоих вариантов и завершается с ошибкой, если ход мира хотя бы раз разошелся, поэтому
+проверку можно запускать после любых изменений правил арбитража. Время на клетку в мире по умолчанию и в большом мире
+показывает, с какого числа живых клеток арбитер выгоднее обхода, по нему выбран порог action.bulk.BULK_MIN_CELLS.
+
+Запуск из корня репозитория:
+
+    python -m benchmarks.arbiter --seeds 0 1 2 --steps 600
+"""
+import argparse
+import hashlib
+import random
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from lib.config import WorldConfig
+from lib.profiler import StepProfiler
+from render import HeadlessRenderer
+from world import World
+
+# сценарии проверки: мир по умолчанию, тесный мир, в котором клетки постоянно спорят за одни и те же ячейки, и большой
+# мир с тысячами живых клеток
+SCENARIOS: Dict[str, dict] = {
+    "default": {},
+    "crowded": dict(rows=20, cols=20, population=250, plant_food_count=50, plant_food_refill=50, start_health=60),
+    "large": dict(rows=112, cols=200, population=2000, plant_food_count=3000, plant_food_refill=3000),
+}
+
+
+def run_world(
+    params: dict, bulk: bool, seed: int, steps: int
+) -> Tuple[List[str], List[Tuple[int, int]], float, int]:
+    """Функция прогоняет мир и запоминает его состояние после каждого шага.
+
+    Args:
+        params (dict): Параметры WorldConfig сценария
+        bulk (bool): Разрешать действия всех клеток сразу
+        seed (int): Зерно генераторов случайных чисел
+        steps (int): Число шагов мира
+
+    Returns:
+        Tuple[List[str], List[Tuple[int, int]], float, int]: Хэши типов ячеек и здоровья после каждого шага, история
+            эпох, время фазы арбитража в секундах и суммарное число клеток, совершивших ход.
+    """
+    random.seed(seed)
+    np.random.seed(seed)
+
+    world = World(HeadlessRenderer(), WorldConfig(bulk_arbiter=bulk, **params))
+    world.profiler = StepProfiler(output=lambda line: None)
+    digests = []
+    for _ in range(steps):
+        world._make_step()
+        digest = hashlib.sha1(world.state.types.tobytes())
+        digest.update(world.state.health.tobytes())
+        digests.append(digest.hexdigest())
+    total = world.profiler.total
+    return digests, list(world.history), total["arbitration"], int(total["cells"])
+
+
+def parse_args() -> argparse.Namespace:
+    """Функция для разбора аргументов командной строки."""
+    parser = argparse.ArgumentParser(description="Проверка и бенчмарк арбитеров мира")
+    parser.add_argument("--scenarios", nargs="+", default=list(SCENARIOS), choices=list(SCENARIOS), help="сценарии")
+    parser.add_argument("--seeds", nargs="+", type=int, default=[0, 1, 2], help="зерна генераторов случайных чисел")
+    parser.add_argument("--steps", type=int, default=600, help="число шагов мира в каждом прогоне")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+
+    mismatches = []
+    for scenario in args.scenarios:
+        for seed in args.seeds:
+            bulk_digests, bulk_history, bulk_seconds, moved = run_world(SCENARIOS[scenario], True, seed, args.steps)
+            cells_digests, cells_history, cells_seconds, _ = run_world(SCENARIOS[scenario], False, seed, args.steps)
+
+            diverged = next(
+                (step for step, (bulk, cells) in enumerate(zip(bulk_digests, cells_digests)) if bulk != cells), None
+            )
+            same = diverged is None and bulk_history == cells_history
+            if not same:
+                mismatches.append((scenario, seed, diverged))
+            print(
+                f"{scenario} seed={seed}: {moved / args.steps:.0f} cells/step, "
+                f"bulk {bulk_seconds * 1e6 / moved:.2f} us/cell, cells {cells_seconds * 1e6 / moved:.2f} us/cell, "
+                f"epochs: {len(bulk_history)}, {'same' if same else f'DIVERGED at step {diverged}'}"
+            )
+
+    if mismatches:
+        raise SystemExit(f"ход мира с BulkArbiter разошелся с обходом клеток по одной: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Бенчмарк вычисления нейронных сетей клеток.
+
+Сравнивает исходное вычисление одной клетки (np.matrix, np.vectorize и math.exp на каждый элемент) с движками из
+neural.engine: ход одной клетки и ходы всех клеток за один вызов. Для каждого варианта печатает время на ход клетки,
+ускорение относительно исходного вычисления и долю ходов, совпавших с ним.
+
+Запуск из корня репозитория:
+
+    python -m benchmarks.inference --cells 256 --repeat 5
+"""
+import argparse
+import math
+import time
+from typing import Callable, List
+
+import numpy as np
+
+from neural.engine import ENGINES, prepare
+
+
+def _legacy_sigmoid(x):
+    return 1 / (1 + math.exp(-x))
+
+
+def legacy_compute(hide_weights: np.matrix, out_weights: np.matrix, inputs: list) -> int:
+    """Функция повторяет исходное вычисление хода клетки, с которым сравниваются движки.
+
+    Args:
+        hide_weights (np.matrix): Веса скрытого слоя
+        out_weights (np.matrix): Веса выходного слоя
+        inputs (list): Входные значения клетки
+
+    Returns:
+        int: Индекс самого яркого выходного нейрона.
+    """
+    vectorized_sigmoid = np.vectorize(_legacy_sigmoid)
+    hidden_outputs = vectorized_sigmoid(np.dot(np.matrix(inputs), hide_weights))
+    result = vectorized_sigmoid(np.dot(hidden_outputs, out_weights))
+    return np.argmax(result.getA()[0])
+
+
+def _measure(run: Callable[[], List[int]], repeat: int) -> float:
+    best = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def parse_args() -> argparse.Namespace:
+    """Функция для разбора аргументов командной строки."""
+    parser = argparse.ArgumentParser(description="Бенчмарк вычисления нейронных сетей клеток")
+    parser.add_argument("--cells", type=int, default=256, help="число клеток, ходы которых вычисляются")
+    parser.add_argument("--hidden", type=int, default=16, help="число нейронов скрытого слоя")
+    parser.add_argument("--repeat", type=int, default=5, help="число повторов замера, берется лучший")
+    parser.add_argument("--seed", type=int, default=42, help="зерно генератора случайных чисел")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+
+    rng = np.random.RandomState(args.seed)
+    hide_weights = rng.uniform(-5.0, 5.0, size=(args.cells, 9, args.hidden))
+    out_weights = rng.uniform(-5.0, 5.0, size=(args.cells, args.hidden, 9))
+    # входные значения клеток - цвета соседних ячеек в диапазоне от 0 до 1
+    inputs = rng.randint(0, 256, size=(args.cells, 9)) / 255
+
+    legacy_weights = [(np.matrix(hide), np.matrix(out)) for hide, out in zip(hide_weights, out_weights)]
+    fast_hide = [prepare(hide) for hide in hide_weights]
+    fast_out = [prepare(out) for out in out_weights]
+    batch_hide = np.stack(fast_hide)
+    batch_out = np.stack(fast_out)
+
+    def run_legacy():
+        return [legacy_compute(hide, out, cell) for (hide, out), cell in zip(legacy_weights, inputs.tolist())]
+
+    expected = run_legacy()
+    legacy_seconds = _measure(run_legacy, args.repeat)
+    print(f"legacy: {legacy_seconds / args.cells * 1e6:.2f} us/cell")
+
+    for name, engine_class in ENGINES.items():
+        engine = engine_class()
+
+        def run_single():
+            return [engine.decide(hide, out, cell) for hide, out, cell in zip(fast_hide, fast_out, inputs)]
+
+        def run_batch():
+            return engine.decide_batch(batch_hide, batch_out, inputs).tolist()
+
+        for mode, run in (("single", run_single), ("batch", run_batch)):
+            # первый вызов не замеряется, numba компилирует функции при первом вызове
+            decisions = run()
+            seconds = _measure(run, args.repeat)
+            agreement = np.mean(np.array(decisions) == np.array(expected))
+            print(
+                f"{name} {mode}: {seconds / args.cells * 1e6:.2f} us/cell, "
+                f"x{legacy_seconds / seconds:.1f} faster, {agreement:.1%} same moves"
+            )
+
+
+if __name__ == "__main__":
+    main()
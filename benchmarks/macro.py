@@ -0,0 +1,136 @@
+"""Макро-бенчмарк мира без отрисовки.
+
+Прогоняет мир с фиксированным зерном на сетке размеров карты, размеров популяции и количества растительной пищи,
+измеряет шаги в секунду, эпохи в секунду и пиковую память, и записывает результаты в JSON, чтобы сравнивать кривые
+масштабирования между версиями.
+
+Запуск из корня репозитория:
+
+    python -m benchmarks.macro --steps 500 --output bench.json
+"""
+import argparse
+import itertools
+import json
+import multiprocessing
+import platform
+import random
+import resource
+import subprocess
+import time
+from typing import List
+
+import numpy as np
+
+from lib.config import WorldConfig
+from render import HeadlessRenderer
+from world import World
+
+SIZES = ("28x50", "56x100", "112x200")
+POPULATIONS = (64, 256)
+FOOD = (150, 600)
+
+
+def run_scenario(rows: int, cols: int, population: int, food: int, steps: int, seed: int) -> dict:
+    """Функция прогоняет один сценарий, вызывается в отдельном процессе, чтобы замер пиковой памяти был честным.
+
+    Args:
+        rows (int): Число строк мира
+        cols (int): Число столбцов мира
+        population (int): Начальная популяция клеток
+        food (int): Число клеток растительной пищи в начале каждой эпохи
+        steps (int): Число шагов мира для замера
+        seed (int): Зерно генераторов случайных чисел
+
+    Returns:
+        dict: Результаты сценария.
+    """
+    config = WorldConfig(rows=rows, cols=cols, population=population, plant_food_count=food, plant_food_refill=food)
+
+    random.seed(seed)
+    np.random.seed(seed)
+
+    start = time.perf_counter()
+    world = World(HeadlessRenderer(), config)
+    setup_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    world.execute(steps=steps)
+    elapsed = time.perf_counter() - start
+
+    epochs = len(world.history)
+    return {
+        "rows": rows,
+        "cols": cols,
+        "population": population,
+        "food": food,
+        "seed": seed,
+        "steps": world.total_steps,
+        "epochs": epochs,
+        "setup_seconds": setup_seconds,
+        "seconds": elapsed,
+        "steps_per_sec": world.total_steps / elapsed,
+        "epochs_per_sec": epochs / elapsed,
+        # в Linux ru_maxrss возвращается в килобайтах
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def _git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _parse_size(size: str) -> List[int]:
+    rows, cols = size.lower().split("x")
+    return [int(rows), int(cols)]
+
+
+def parse_args() -> argparse.Namespace:
+    """Функция для разбора аргументов командной строки."""
+    parser = argparse.ArgumentParser(description="Макро-бенчмарк мира без отрисовки")
+    parser.add_argument("--sizes", nargs="+", default=SIZES, help="размеры карты в виде СТРОКИxСТОЛБЦЫ")
+    parser.add_argument("--populations", nargs="+", type=int, default=POPULATIONS, help="начальные популяции")
+    parser.add_argument("--food", nargs="+", type=int, default=FOOD, help="количества растительной пищи")
+    parser.add_argument("--steps", type=int, default=500, help="число шагов в каждом сценарии")
+    parser.add_argument("--seed", type=int, default=42, help="зерно генераторов случайных чисел")
+    parser.add_argument("--output", default="bench_results.json", help="файл для результатов в формате JSON")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+
+    # каждый сценарий запускается в чистом процессе, чтобы пиковая память процесса не накапливалась между
+    # сценариями
+    context = multiprocessing.get_context("spawn")
+    results = []
+    for size, population, food in itertools.product(args.sizes, args.populations, args.food):
+        rows, cols = _parse_size(size)
+        with context.Pool(1) as pool:
+            result = pool.apply(run_scenario, (rows, cols, population, food, args.steps, args.seed))
+        results.append(result)
+        print(
+            f"{rows}x{cols} population={population} food={food}: {result['steps_per_sec']:.1f} steps/s, "
+            f"{result['epochs_per_sec']:.2f} epochs/s, {result['peak_rss_mb']:.1f} MB"
+        )
+
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "revision": _git_revision(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+        },
+        "results": results,
+    }
+    with open(args.output, "w") as output:
+        json.dump(report, output, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Проверка воспроизводимости мира из тайлов.
+
+Прогоняет мир с фиксированными зернами заданное число шагов и сравнивает историю эпох:
+
+- один тайл должен давать тот же ход мира, что и обычный мир;
+- N тайлов, шагающих в процессах, должны давать тот же ход мира, что и N тайлов в одном процессе.
+
+Печатает время прогонов и завершается с ошибкой, если хотя бы одна пара историй разошлась.
+
+Запуск из корня репозитория:
+
+    python -m benchmarks.tiles --tiles 2 4 --seeds 0 1 2 --steps 600
+"""
+import argparse
+import random
+import time
+from typing import Callable, List, Tuple
+
+import numpy as np
+
+from lib.config import WorldConfig
+from lib.tiles import TiledWorld
+from render import HeadlessRenderer
+from world import World
+
+CONFIG = dict(rows=40, cols=60, population=80, plant_food_count=300, plant_food_refill=300)
+
+
+def run_history(make_world: Callable[[], World], seed: int, steps: int) -> Tuple[List[Tuple[int, int]], float]:
+    """Функция прогоняет мир заданное число шагов.
+
+    Ограничивается число шагов, а не эпох, так как эпоха с удачным геномом может длиться очень долго.
+
+    Args:
+        make_world (Callable[[], World]): Функция, создающая мир или мир из тайлов
+        seed (int): Зерно генераторов случайных чисел
+        steps (int): Общее число шагов мира
+
+    Returns:
+        Tuple[List[Tuple[int, int]], float]: История эпох и время прогона в секундах.
+    """
+    random.seed(seed)
+    np.random.seed(seed)
+
+    start = time.perf_counter()
+    world = make_world()
+    try:
+        world.execute(steps=steps, cadence=None)
+    finally:
+        if isinstance(world, TiledWorld):
+            world.close()
+    return list(world.history), time.perf_counter() - start
+
+
+def parse_args() -> argparse.Namespace:
+    """Функция для разбора аргументов командной строки."""
+    parser = argparse.ArgumentParser(description="Проверка воспроизводимости мира из тайлов")
+    parser.add_argument("--tiles", nargs="+", type=int, default=[2, 4], help="числа тайлов")
+    parser.add_argument("--seeds", nargs="+", type=int, default=[0, 1, 2], help="зерна генераторов случайных чисел")
+    parser.add_argument("--steps", type=int, default=600, help="число шагов мира в каждом прогоне")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    config = WorldConfig(**CONFIG)
+
+    mismatches = []
+    for seed in args.seeds:
+        base, base_seconds = run_history(lambda: World(HeadlessRenderer(), config), seed, args.steps)
+        one, one_seconds = run_history(
+            lambda: TiledWorld(HeadlessRenderer(), config, tiles=1, processes=False), seed, args.steps
+        )
+        if one != base:
+            mismatches.append((seed, 1))
+        print(
+            f"seed={seed} world: {base_seconds:.2f} s, 1 tile: {one_seconds:.2f} s, "
+            f"{'same' if one == base else 'DIVERGED'}"
+        )
+
+        for tiles in args.tiles:
+            local, local_seconds = run_history(
+                lambda: TiledWorld(HeadlessRenderer(), config, tiles=tiles, processes=False), seed, args.steps
+            )
+            pooled, pooled_seconds = run_history(
+                lambda: TiledWorld(HeadlessRenderer(), config, tiles=tiles, processes=True), seed, args.steps
+            )
+            if local != pooled:
+                mismatches.append((seed, tiles))
+            print(
+                f"seed={seed} {tiles} tiles: local {local_seconds:.2f} s, processes {pooled_seconds:.2f} s, "
+                f"{'same' if local == pooled else 'DIVERGED'}"
+            )
+
+    if mismatches:
+        raise SystemExit(f"ход мира из тайлов разошелся, (зерно, число тайлов): {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
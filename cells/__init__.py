@@ -1,4 +1,4 @@
-from .wall import Wall
-from .empty import Empty
-from .food import PlantFood, Food
-from .base import BaseCell
+from .wall import Wall, WALL
+from .empty import Empty, EMPTY
+from .food import PlantFood, Food, PLANT_FOOD
+from .base import BaseCell, FlyweightCell
@@ -2,14 +2,19 @@ from abc import ABC, abstractmethod
 
 
 class BaseCell(ABC):
-    """Абстрактный класс, представляющий собой базовый класс для создания ячеек."""
+    """Абстрактный класс, представляющий собой базовый класс для создания ячеек.
 
-    def __init__(self):
-        self.MAP_ID = None
-        self.FIXED = True
-        self.SOLID = True
-        self.COST = -1.0
-        self.NOT_ACTIVE_COST = -1.0  # вес ячейки которая находится в состоянии не подлежащем взаимодействию
+    Ячейки не хранят свое расположение и id у отрисовщика: id ячейки определяется ее позицией в мире и хранится в
+    WorldState.map_ids. Неизменные свойства типа ячейки заданы атрибутами класса, а не каждого объекта.
+    """
+
+    __slots__ = ()
+
+    CODE: int = None  # код типа ячейки, под которым она хранится в представлении мира массивами
+    FIXED = True
+    SOLID = True
+    COST = -1.0
+    NOT_ACTIVE_COST = -1.0  # вес ячейки которая находится в состоянии не подлежащем взаимодействию
 
     @property
     @abstractmethod
@@ -27,10 +32,6 @@ class BaseCell(ABC):
         """Метод возвращает информацию, может ли клетка ходить."""
         return not self.FIXED
 
-    @property
-    def get_id(self) -> int:
-        return self.MAP_ID
-
     @property
     def get_cost(self) -> float:
         """Параметр определяющий стоимость ячейки для ее определения в нейросети."""
@@ -38,22 +39,22 @@ class BaseCell(ABC):
             return self.NOT_ACTIVE_COST
         return self.COST
 
-    def set_id(self, map_id: int) -> 'BaseCell':
-        """Метод установки id ячейки.
+    def __repr__(self):
+        return self.__class__.__name__
 
-        Args:
-            map_id (int): id ячейки.
-        """
-        self.MAP_ID = map_id
-        return self
 
-    def __repr__(self):
-        return f"{self.__class__.__name__}: {self.MAP_ID}"
+class FlyweightCell(BaseCell):
+    """Базовый класс легковесных ячеек, у которых нет собственного состояния.
+
+    У каждого такого класса существует единственный объект, его возвращает любой вызов конструктора, в том числе при
+    восстановлении из pickle, поэтому ячейки одного типа можно сравнивать через is.
+    """
 
-    def duck_typing(self) -> dict:
-        """Метод для проведения утиной типизации.
+    __slots__ = ()
 
-        Returns:
-            dict: Объект на основании которого будет проводиться типизация.
-        """
-        return {"name": self.__class__.__name__, "map_id": self.MAP_ID}
+    def __new__(cls):
+        instance = cls.__dict__.get("_instance")
+        if instance is None:
+            instance = super().__new__(cls)
+            cls._instance = instance
+        return instance
@@ -1,6 +1,6 @@
 import settings
 
-from cells.base import BaseCell
+from cells.base import FlyweightCell
 
 
 class EmptyType:
@@ -10,19 +10,19 @@ class EmptyType:
     HEALTH = -1
 
 
-class Empty(BaseCell):
+class Empty(FlyweightCell):
     """Легковес пустой ячейки, из которых по умолчанию состоит мир."""
 
-    TYPE = EmptyType()
+    __slots__ = ()
 
-    def __init__(self):
-        super().__init__()
-        self.SOLID = False
-        self.COST = 0.0
+    TYPE = EmptyType()
+    CODE = 0
+    SOLID = False
+    COST = 0.0
 
     @property
     def get_color(self):
         return self.TYPE.COLOR
 
-    def busy(self):
-        self.SOLID = True
+
+EMPTY = Empty()
@@ -1,41 +1,35 @@
 import settings
 
-from cells.base import BaseCell
+from cells.base import FlyweightCell
 
 
-class Food(BaseCell):
-    """Общий класс для реализации клеток пищи."""
+class Food(FlyweightCell):
+    """Общий класс для реализации клеток пищи.
 
-    def __init__(self):
-        super().__init__()
-        self.HEALTH = 1
-        self.COST = 0.5
+    Пища на карте всегда съедобна: съеденная пища сразу заменяется пустой ячейкой, поэтому у ячейки пищи нет
+    собственного состояния и она тоже является легковесом.
+    """
 
-    def eat(self) -> None:
-        """Метод для поедания клетки."""
-        self.HEALTH = 0
+    __slots__ = ()
 
-    @property
-    def get_cost(self) -> None:
-        if self.can_eat:
-            return self.COST
-        return self.NOT_ACTIVE_COST
+    COST = 0.5
 
     @property
-    def can_eat(self) -> bool:
-        """Метод для проверки, можно ли съесть клетку.
-
-        Returns:
-            bool: True - если клетка съедобная и False если клетка не съедобная
-        """
-        return self.HEALTH > 0
+    def get_cost(self) -> float:
+        return self.COST
 
 
 class PlantFood(Food):
     """Класс ячейки растительной еды."""
 
+    __slots__ = ()
+
     COLOR = settings.PLANT_FOOD
+    CODE = 2
 
     @property
     def get_color(self):
         return self.COLOR
+
+
+PLANT_FOOD = PlantFood()
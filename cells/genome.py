@@ -0,0 +1,58 @@
+from typing import List
+
+import numpy as np
+
+from neural.neural_network import NeuralNetwork
+
+
+def _freeze(weights) -> np.ndarray:
+    layer = np.asarray(weights, dtype=np.float64)
+    layer.setflags(write=False)
+    return layer
+
+
+class Genome:
+    """Неизменяемый геном клетки: веса скрытого и выходного слоя и построенная по ним нейронная сеть.
+
+    Клетки одного клана ссылаются на один объект генома, поэтому деление клетки не копирует веса и не создает новую
+    сеть. Массивы весов доступны только для чтения, новый геном создается только при мутации или скрещивании.
+    """
+
+    __slots__ = ("hide_weights", "out_weights", "network")
+
+    def __init__(self, hide_weights, out_weights):
+        """
+        Args:
+            hide_weights: Веса скрытого слоя, массив не копируется и становится доступным только для чтения
+            out_weights: Веса выходного слоя, массив не копируется и становится доступным только для чтения
+        """
+        self.hide_weights = _freeze(hide_weights)
+        self.out_weights = _freeze(out_weights)
+        self.network = NeuralNetwork(self.hide_weights, self.out_weights)
+
+    @classmethod
+    def random(cls, hidden_neurons: int = 16) -> "Genome":
+        """Метод создает геном со случайными весами.
+
+        Args:
+            hidden_neurons (int, optional): Число нейронов скрытого слоя. Defaults to 16.
+
+        Returns:
+            Genome: Новый геном.
+        """
+        return cls(
+            np.random.uniform(low=-5.0, high=5.0, size=(9, hidden_neurons)),
+            np.random.uniform(low=-5.0, high=5.0, size=(hidden_neurons, 9)),
+        )
+
+    def layers(self) -> List[np.ndarray]:
+        """Метод возвращает слои генома без копирования, массивы доступны только для чтения.
+
+        Returns:
+            List[np.ndarray]: Веса слоев в порядке расположения слоев.
+        """
+        return [self.hide_weights, self.out_weights]
+
+    def __reduce__(self):
+        # сеть не сохраняется, она строится заново по весам
+        return self.__class__, (self.hide_weights, self.out_weights)
@@ -1,45 +1,65 @@
-import uuid
 from abc import abstractmethod
 
 import numpy as np
-from action.move import Move, MoveBuilder
 from cells.base import BaseCell
-from neural.neural_network import NeuralNetwork
+from cells.genome import Genome
+from cells.live.clans import DEFAULT_REGISTRY
+from cells.live.events import LifeEvents
 from settings import CELL_HERBIVORE
 
 
 class BaseLive(BaseCell):
     """Базовый класс для живых клеток."""
 
-    BORN_SUBSCRIBERS = []  # подписчики для события рождения новой клетки
-    DEATH_SUBSCRIBERS = []  # подписчики для события смерти клетки
+    __slots__ = ("events", "HEALTH", "AGE", "FOOD_EATEN", "COLOR", "CLAN_NAME", "ACTION", "genome")
 
-    def __init__(self, genome=None, health=25, clan=None, color=CELL_HERBIVORE):
-        super().__init__()
+    FIXED = False
+
+    def __init__(
+        self, genome=None, health=25, clan=None, color=CELL_HERBIVORE, events: LifeEvents = None, hidden_neurons=16
+    ):
+        # события клетки общие для всех клеток мира, без мира у клетки нет подписчиков
+        self.events = events if events is not None else LifeEvents()
         self.HEALTH = health
-        self.FIXED = False
-        self.HIDE_WEIGHTS = None
-        self.OUT_WEIGHTS = None
+        self.AGE = 0  # число шагов, которые прожила клетка
+        self.FOOD_EATEN = 0  # число съеденных клеткой ячеек пищи
         self.COLOR = color
-        # переменная определяющая имя клана, чтобы можно было определить клетки с одинаковым геномом
-        # дети, с мутировавшим геномом, относятся к другому клану
+        # номер клана из реестра кланов мира, чтобы можно было определить клетки с одинаковым геномом
+        # дети, с мутировавшим геномом, относятся к другому клану. клетка, созданная вне мира, получает клан из общего
+        # реестра
         if clan is None:
-            self.CLAN_NAME = uuid.uuid4()
+            self.CLAN_NAME = DEFAULT_REGISTRY.register()
         else:
             self.CLAN_NAME = clan
 
-        self._move_info = MoveBuilder()
+        self.ACTION = 0  # индекс выходного нейрона последнего действия, код действия из action.opcodes.ACTIONS
 
-        if genome is not None:
+        # геном общий для клеток клана, переданный объект Genome не копируется
+        if isinstance(genome, Genome):
+            self.genome = genome
+        elif genome is not None:
             self._set_genome(*genome)
         else:
-            self._generate_genome()
+            self._generate_genome(hidden_neurons)
+
+    def __getstate__(self) -> dict:
+        state = {name: getattr(self, name) for name in BaseLive.__slots__}
+        # подписчики принадлежат миру клетки и не переносятся вместе с ней в другой процесс
+        state["events"] = None
+        return state
 
-        self.neurons = NeuralNetwork(self.HIDE_WEIGHTS, self.OUT_WEIGHTS)
+    def __setstate__(self, state: dict) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+        self.events = LifeEvents()
 
     @abstractmethod
-    def got_food(self):
-        """Метод для установки внутреннего состояния клетки, после того как клетка поела."""
+    def got_food(self, energy: int):
+        """Метод для установки внутреннего состояния клетки, после того как клетка поела.
+
+        Args:
+            energy (int): Здоровье, которое клетка получает от пищи
+        """
         pass
 
     @abstractmethod
@@ -47,23 +67,31 @@ class BaseLive(BaseCell):
         """Метод для совершения шага клеткой."""
         pass
 
-    @classmethod
-    def add_born_sub(cls, subscriber):
-        """Метод для добавления подписчика на событие рождения клетки.
+    @abstractmethod
+    def apply_move(self, move_number: int) -> None:
+        """Метод для совершения шага клеткой по уже вычисленному действию.
+
+        Используется, когда ходы всех клеток вычисляются сразу пакетно.
 
         Args:
-            subscriber (callack): Колбэк, который будет вызываться при обработке события на которое подписался объект
+            move_number (int): Индекс самого яркого выходного нейрона, он определяет действие
         """
-        cls.BORN_SUBSCRIBERS.append(subscriber)
+        pass
 
-    @classmethod
-    def add_death_sub(cls, subscriber):
-        """Метод для добавления подписчика на событие смерти клетки.
+    @property
+    def HIDE_WEIGHTS(self) -> np.ndarray:
+        """Веса скрытого слоя генома, только для чтения."""
+        return self.genome.hide_weights
 
-        Args:
-            subscriber (callback): Колбэк, который будет вызываться при обработке события на которое подписался объект
-        """
-        cls.DEATH_SUBSCRIBERS.append(subscriber)
+    @property
+    def OUT_WEIGHTS(self) -> np.ndarray:
+        """Веса выходного слоя генома, только для чтения."""
+        return self.genome.out_weights
+
+    @property
+    def neurons(self):
+        """Нейронная сеть генома клетки."""
+        return self.genome.network
 
     def _set_genome(self, hide_weights: np.array, out_weights: np.array) -> None:
         """Метод производит установку весов, который отвечает за поведение клетки и представляет ее геном.
@@ -72,14 +100,15 @@ class BaseLive(BaseCell):
             hide_weights (np.array): Веса для скрытого слоя
             out_weights (np.array): Веса для слова вывода информации.
         """
-        self.HIDE_WEIGHTS = hide_weights
-        self.OUT_WEIGHTS = out_weights
+        self.genome = Genome(hide_weights, out_weights)
 
-    def _generate_genome(self) -> None:
-        """Метод для начальной генерации случайных весов для генома клетки."""
-        self._set_genome(
-            np.random.uniform(low=-5.0, high=5.0, size=(9, 16)), np.random.uniform(low=-5.0, high=5.0, size=(16, 9))
-        )
+    def _generate_genome(self, hidden_neurons: int = 16) -> None:
+        """Метод для начальной генерации случайных весов для генома клетки.
+
+        Args:
+            hidden_neurons (int, optional): Число нейронов скрытого слоя. Defaults to 16.
+        """
+        self.genome = Genome.random(hidden_neurons)
 
     def save_genome(self) -> list:
         """Метод возвращает текущий геном клетки.
@@ -90,18 +119,6 @@ class BaseLive(BaseCell):
         """
         return [np.copy(self.HIDE_WEIGHTS), np.copy(self.OUT_WEIGHTS)]
 
-    def get_move_info(self) -> Move:
-        """Метод формирует объект класса Move с информацией о движении клеток и возвращает его.
-
-        Returns:
-            Move: Объект класса Move.
-        """
-        return self._move_info.build()
-
-    def reset_move_info(self) -> None:
-        """Метод производит сброс настроек об информации движения клетки."""
-        self._move_info.reset()
-
     def _change_health(self, count: int = -1):
         """Метод для изменения здоровья клетки.
 
@@ -115,8 +132,14 @@ class BaseLive(BaseCell):
         # проверяем сразу, если клетка умерла после изменения здоровья, вызываем всех подписчиков подписанных
         # на данное событие
         if self.is_dead:
-            for sub in self.DEATH_SUBSCRIBERS:
-                sub.die_cell(self)
+            self.events.died(self)
+
+    def share_health(self) -> None:
+        """Метод уменьшает здоровье клетки при делении, ребенок получает столько же здоровья, сколько остается у нее.
+
+        Отдельно от reprodaction вызывается, когда ребенка создает тайл мира, которому принадлежит его ячейка.
+        """
+        self._change_health(-1 * round(self.HEALTH / 2))
 
     def reprodaction(self) -> "BaseLive":
         """Интерфейс прототипа для создания копии клетки.
@@ -139,7 +162,7 @@ class BaseLive(BaseCell):
         return self.COLOR
 
     @property
-    def get_clan_name(self) -> str:
+    def get_clan_name(self) -> int:
         return self.CLAN_NAME
 
     @staticmethod
@@ -158,6 +181,16 @@ class BaseLive(BaseCell):
         """
         return self.HEALTH <= 0
 
+    @property
+    def get_age(self) -> int:
+        """Свойство возвращающее число шагов, которые прожила клетка."""
+        return self.AGE
+
+    @property
+    def get_food_eaten(self) -> int:
+        """Свойство возвращающее число съеденных клеткой ячеек пищи."""
+        return self.FOOD_EATEN
+
     @property
     def get_health(self) -> int:
         """Свойство возвращающее текущее здоровье клетки.
@@ -0,0 +1,212 @@
+from typing import Dict, List
+
+import numpy as np
+
+# происхождение клана: случайный геном, мутация генома родителя, скрещивание двух родителей, мутация скрещенного
+# генома и геном, пришедший извне мира, например с другого острова или из архива
+RANDOM = 0
+MUTATION = 1
+CROSSING = 2
+CROSSING_MUTATION = 3
+IMPORTED = 4
+ORIGINS = ("random", "mutation", "crossing", "crossing_mutation", "imported")
+
+NO_PARENT = -1
+
+
+class ClanRegistry:
+    """Класс реестра кланов мира.
+
+    Выдает кланам целые номера по порядку и хранит для каждого клана родителей, эпоху рождения и происхождение в
+    компактных массивах, индекс в которых равен номеру клана. По реестру можно восстановить родословную любого клана.
+    У скрещенного клана два родителя: основной - лучшая клетка эпохи, и второй - вторая лучшая клетка.
+
+    Клан соответствует одному геному: клетки группы нового поколения с общим геномом составляют один клан, поэтому
+    каждая эпоха добавляет в реестр четыре клана, а не по клану на каждую клетку.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        """
+        Args:
+            capacity (int, optional): Начальный размер массивов, при нехватке места они увеличиваются вдвое.
+                Defaults to 1024.
+        """
+        self._count = 0
+        self._parent = np.full(capacity, NO_PARENT, dtype=np.int64)
+        self._co_parent = np.full(capacity, NO_PARENT, dtype=np.int64)
+        self._epoch = np.zeros(capacity, dtype=np.int32)
+        self._origin = np.zeros(capacity, dtype=np.int8)
+
+    def register(
+        self, epoch: int = 0, origin: int = RANDOM, parent: int = NO_PARENT, co_parent: int = NO_PARENT
+    ) -> int:
+        """Метод регистрирует новый клан.
+
+        Args:
+            epoch (int, optional): Эпоха рождения клана. Defaults to 0.
+            origin (int, optional): Происхождение клана, одна из констант RANDOM, MUTATION, CROSSING,
+                CROSSING_MUTATION, IMPORTED. Defaults to RANDOM.
+            parent (int, optional): Основной родительский клан. Defaults to NO_PARENT.
+            co_parent (int, optional): Второй родительский клан при скрещивании. Defaults to NO_PARENT.
+
+        Returns:
+            int: Номер нового клана.
+        """
+        clan = self._count
+        if clan == len(self._parent):
+            self._grow(2 * len(self._parent))
+        self._parent[clan] = parent
+        self._co_parent[clan] = co_parent
+        self._epoch[clan] = epoch
+        self._origin[clan] = origin
+        self._count += 1
+        return clan
+
+    def _grow(self, capacity: int) -> None:
+        for name, fill in (("_parent", NO_PARENT), ("_co_parent", NO_PARENT), ("_epoch", 0), ("_origin", 0)):
+            old = getattr(self, name)
+            new = np.full(max(capacity, 1), fill, dtype=old.dtype)
+            new[: self._count] = old[: self._count]
+            setattr(self, name, new)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, clan: int) -> bool:
+        return 0 <= clan < self._count
+
+    def parents(self, clan: int) -> List[int]:
+        """Метод возвращает родительские кланы клана.
+
+        Args:
+            clan (int): Номер клана
+
+        Returns:
+            List[int]: Номера родителей, основной идет первым, пустой список у клана без родителей.
+        """
+        return [int(parent) for parent in (self._parent[clan], self._co_parent[clan]) if parent != NO_PARENT]
+
+    def info(self, clan: int) -> Dict[str, object]:
+        """Метод возвращает сведения о клане.
+
+        Args:
+            clan (int): Номер клана
+
+        Returns:
+            Dict[str, object]: Номер, эпоха рождения, происхождение и родители клана.
+        """
+        return {
+            "clan": clan,
+            "epoch": int(self._epoch[clan]),
+            "origin": ORIGINS[self._origin[clan]],
+            "parents": self.parents(clan),
+        }
+
+    def ancestors(self, clan: int) -> List[int]:
+        """Метод возвращает цепочку основных предков клана.
+
+        Args:
+            clan (int): Номер клана
+
+        Returns:
+            List[int]: Номера кланов от самого клана до его самого далекого предка по основной линии.
+        """
+        chain = [clan]
+        while self._parent[chain[-1]] != NO_PARENT:
+            chain.append(int(self._parent[chain[-1]]))
+        return chain
+
+    def lineage(self, clan: int, depth: int = None) -> Dict[int, Dict[str, object]]:
+        """Метод собирает всех предков клана по обоим родителям.
+
+        У клана может быть два родителя, поэтому родословная - это граф, в котором один предок достижим несколькими
+        путями. Граф обходится в ширину без рекурсии, и каждый предок попадает в результат один раз, а связи между
+        кланами хранятся в списках родителей.
+
+        Args:
+            clan (int): Номер клана
+            depth (int, optional): Число поколений предков, None - до кланов без родителей. Defaults to None.
+
+        Returns:
+            Dict[int, Dict[str, object]]: Номер клана -> сведения о нем из info, начиная с самого клана, в порядке
+                удаления от него.
+        """
+        nodes = {clan: self.info(clan)}
+        generation = [clan]
+        while generation and (depth is None or depth > 0):
+            next_generation = []
+            for node in generation:
+                for parent in nodes[node]["parents"]:
+                    if parent not in nodes:
+                        nodes[parent] = self.info(parent)
+                        next_generation.append(parent)
+            generation = next_generation
+            if depth is not None:
+                depth -= 1
+        return nodes
+
+    def children(self, clan: int) -> List[int]:
+        """Метод возвращает кланы, у которых переданный клан является одним из родителей.
+
+        Args:
+            clan (int): Номер клана
+
+        Returns:
+            List[int]: Номера дочерних кланов по порядку рождения.
+        """
+        count = self._count
+        mask = (self._parent[:count] == clan) | (self._co_parent[:count] == clan)
+        return np.flatnonzero(mask).tolist()
+
+    def descendants(self, clan: int) -> List[int]:
+        """Метод возвращает всех потомков клана.
+
+        Args:
+            clan (int): Номер клана
+
+        Returns:
+            List[int]: Номера кланов-потомков по порядку рождения.
+        """
+        count = self._count
+        found = np.zeros(count, dtype=bool)
+        found[clan] = True
+        # родитель всегда зарегистрирован раньше потомка, поэтому достаточно одного прохода по порядку рождения
+        for child in range(clan + 1, count):
+            parent, co_parent = self._parent[child], self._co_parent[child]
+            if (parent != NO_PARENT and found[parent]) or (co_parent != NO_PARENT and found[co_parent]):
+                found[child] = True
+        found[clan] = False
+        return np.flatnonzero(found).tolist()
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """Метод возвращает копии массивов реестра, например, для контрольной точки.
+
+        Returns:
+            Dict[str, np.ndarray]: Массивы parent, co_parent, epoch и origin.
+        """
+        count = self._count
+        return {
+            "parent": self._parent[:count].copy(),
+            "co_parent": self._co_parent[:count].copy(),
+            "epoch": self._epoch[:count].copy(),
+            "origin": self._origin[:count].copy(),
+        }
+
+    @classmethod
+    def from_arrays(cls, parent: np.ndarray, co_parent: np.ndarray, epoch: np.ndarray, origin: np.ndarray):
+        """Метод восстанавливает реестр из массивов, полученных из to_arrays.
+
+        Returns:
+            ClanRegistry: Восстановленный реестр.
+        """
+        registry = cls(max(len(parent), 1))
+        registry._count = len(parent)
+        registry._parent[: len(parent)] = parent
+        registry._co_parent[: len(parent)] = co_parent
+        registry._epoch[: len(parent)] = epoch
+        registry._origin[: len(parent)] = origin
+        return registry
+
+
+# реестр кланов клеток, созданных вне мира
+DEFAULT_REGISTRY = ClanRegistry()
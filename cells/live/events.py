@@ -0,0 +1,40 @@
+class LifeEvents:
+    """Класс событий рождения и смерти живых клеток одного мира.
+
+    Мир создает свой объект событий и передает его клеткам, а клетки передают его своим детям, поэтому подписчики
+    одного мира не получают события клеток другого мира.
+    """
+
+    def __init__(self):
+        self._born_subscribers = []  # подписчики для события рождения новой клетки
+        self._death_subscribers = []  # подписчики для события смерти клетки
+
+    def add_born_sub(self, subscriber) -> None:
+        """Метод для добавления подписчика на событие рождения клетки.
+
+        Args:
+            subscriber (callack): Колбэк, который будет вызываться при обработке события на которое подписался объект
+        """
+        self._born_subscribers.append(subscriber)
+
+    def add_death_sub(self, subscriber) -> None:
+        """Метод для добавления подписчика на событие смерти клетки.
+
+        Args:
+            subscriber (callback): Колбэк, который будет вызываться при обработке события на которое подписался объект
+        """
+        self._death_subscribers.append(subscriber)
+
+    def born(self) -> None:
+        """Метод оповещает подписчиков о рождении новой клетки."""
+        for sub in self._born_subscribers:
+            sub.new_cell()
+
+    def died(self, cell) -> None:
+        """Метод оповещает подписчиков о смерти клетки.
+
+        Args:
+            cell (BaseLive): Умершая клетка
+        """
+        for sub in self._death_subscribers:
+            sub.die_cell(cell)
@@ -8,7 +8,14 @@ from cells.live.base import BaseLive
 class Reprodaction:
     """Класс отвечающий за размножение клеток."""
 
-    def crossing(self, cell_one: BaseLive, cell_two: BaseLive) -> array:
+    def __init__(self, mutation_rate: float = 0.1):
+        """
+        Args:
+            mutation_rate (float, optional): Вероятность мутации каждого веса генома. Defaults to 0.1.
+        """
+        self.mutation_rate = mutation_rate
+
+    def crossing(self, cell_one: BaseLive, cell_two: BaseLive) -> list:
         """Метод производит скрещивание двух переданных клеток и возвращает скрещенный геном.
 
         Args:
@@ -16,10 +23,11 @@ class Reprodaction:
             cell_two (BaseLive): Вторая клетка для скрещивания
 
         Returns:
-            list: геном скрещенной клетки.
+            list: геном скрещенной клетки, слои расположены в порядке расположения слоев.
         """
-        first_genome = cell_one.save_genome()
-        second_genome = cell_two.save_genome()
+        # геномы только читаются, новый геном собирается в отдельные массивы
+        first_genome = cell_one.genome.layers()
+        second_genome = cell_two.genome.layers()
 
         counter = 0
 
@@ -37,13 +45,15 @@ class Reprodaction:
                 new_layer.append(new_gen.copy())
             new_genome.append(new_layer.copy())
 
-        return array(new_genome)
+        # слои генома разной формы, поэтому каждый слой оборачивается в массив отдельно
+        return [array(layer) for layer in new_genome]
 
     def mutation(self, genome: array, delta=0.15) -> array:
         """Метод производит мутацию переданного в него генома.
 
         Args:
             genome (array): Геном который должен быть подвержен мутации
+            delta (float, optional): Величина, на которую изменяется мутировавший вес. Defaults to 0.15.
 
         Returns:
             array: Мутировавший геном.
@@ -53,7 +63,7 @@ class Reprodaction:
         for gen in genome:
             new_gen = list()
             for nucleotide in gen:
-                if random.random() < 0.1:
+                if random.random() < self.mutation_rate:
                     new_gen.append(nucleotide + random.choice([-1, 1]) * delta)
                 else:
                     new_gen.append(nucleotide)
@@ -1,6 +1,6 @@
 import settings
 
-from cells.base import BaseCell
+from cells.base import FlyweightCell
 
 
 class WallType:
@@ -10,11 +10,17 @@ class WallType:
     HEALTH = -1
 
 
-class Wall(BaseCell):
+class Wall(FlyweightCell):
     """Легковес ячейки стены, они не обладают никакими свойствами, кроме того что через них нельзя пройти."""
 
+    __slots__ = ()
+
     TYPE = WallType()
+    CODE = 1
 
     @property
     def get_color(self):
         return self.TYPE.COLOR
+
+
+WALL = Wall()
@@ -0,0 +1,212 @@
+import sqlite3
+import time
+from typing import List
+
+import numpy as np
+
+from cells.live.herbivore import Herbivore
+from world import World
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    started TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS genomes (
+    id INTEGER PRIMARY KEY,
+    run INTEGER NOT NULL DEFAULT 0,
+    epoch INTEGER NOT NULL,
+    clan INTEGER NOT NULL,
+    lifetime INTEGER NOT NULL,
+    fitness REAL NOT NULL,
+    inputs INTEGER NOT NULL,
+    hidden INTEGER NOT NULL,
+    outputs INTEGER NOT NULL,
+    hide_weights BLOB NOT NULL,
+    out_weights BLOB NOT NULL
+);
+"""
+
+# индексы создаются после добавления столбца run в базы, созданные до его появления
+INDEXES = """
+CREATE INDEX IF NOT EXISTS genomes_fitness ON genomes (fitness DESC);
+DROP INDEX IF EXISTS genomes_clan;
+CREATE INDEX IF NOT EXISTS genomes_run_clan ON genomes (run, clan, fitness DESC);
+"""
+
+COLUMNS = "id, run, epoch, clan, lifetime, fitness, inputs, hidden, outputs, hide_weights, out_weights"
+
+
+class GenomeArchive:
+    """Класс архива лучших геномов в базе SQLite.
+
+    Подписывается на завершение эпох мира и сохраняет две лучшие клетки каждой эпохи: геном (веса слоев в виде
+    массивов байт), клан, эпоху, время жизни и приспособленность. Лучшие геномы архива можно использовать как
+    начальное поколение нового запуска вместо случайных весов.
+
+    В одном архиве хранятся геномы многих запусков, а номера кланов уникальны только в пределах запуска, поэтому
+    каждая запись хранит номер запуска. Запуск регистрируется при первой записи геномов через этот объект архива.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): Путь к файлу базы, файл создается, если его нет
+        """
+        self._connection = sqlite3.connect(path)
+        self._connection.executescript(SCHEMA)
+        columns = [row[1] for row in self._connection.execute("PRAGMA table_info(genomes)")]
+        if "run" not in columns:
+            self._connection.execute("ALTER TABLE genomes ADD COLUMN run INTEGER NOT NULL DEFAULT 0")
+        self._connection.executescript(INDEXES)
+        self.run: int = None  # номер запуска, под которым сохраняются геномы, None - этот объект еще не писал
+
+    def _current_run(self) -> int:
+        if self.run is None:
+            with self._connection:
+                cursor = self._connection.execute(
+                    "INSERT INTO runs (started) VALUES (?)", (time.strftime("%Y-%m-%dT%H:%M:%S"),)
+                )
+            self.run = cursor.lastrowid
+        return self.run
+
+    def end_epoch(self, world: World) -> None:
+        """Метод вызывается миром после завершения эпохи.
+
+        Args:
+            world (World): Мир, завершивший эпоху
+        """
+        epoch, _ = world.history[-1]
+        self.add(epoch, world.best_cells, [world.grave.fitness(cell) for cell in world.best_cells])
+
+    def add(self, epoch: int, cells: List[Herbivore], fitness: List[float] = None) -> None:
+        """Метод сохраняет геномы клеток в архив.
+
+        Args:
+            epoch (int): Эпоха, в которой жили клетки
+            cells (List[Herbivore]): Клетки, геномы которых сохраняются
+            fitness (List[float], optional): Приспособленность каждой клетки, None - равна числу прожитых клеткой
+                шагов. Defaults to None.
+        """
+        if fitness is None:
+            fitness = [cell.get_age for cell in cells]
+
+        run = self._current_run()
+        rows = []
+        for cell, cell_fitness in zip(cells, fitness):
+            hide_weights, out_weights = (
+                np.ascontiguousarray(layer, dtype=np.float64) for layer in cell.genome.layers()
+            )
+            inputs, hidden = hide_weights.shape
+            rows.append(
+                (
+                    run,
+                    epoch,
+                    cell.get_clan_name,
+                    cell.get_age,
+                    cell_fitness,
+                    inputs,
+                    hidden,
+                    out_weights.shape[1],
+                    hide_weights.tobytes(),
+                    out_weights.tobytes(),
+                )
+            )
+        with self._connection:
+            self._connection.executemany(
+                "INSERT INTO genomes (run, epoch, clan, lifetime, fitness, inputs, hidden, outputs, hide_weights, "
+                "out_weights) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def top(self, count: int = 10) -> List[dict]:
+        """Метод возвращает самые приспособленные геномы архива.
+
+        Args:
+            count (int, optional): Число геномов. Defaults to 10.
+
+        Returns:
+            List[dict]: Записи архива, от самой приспособленной.
+        """
+        cursor = self._connection.execute(
+            f"SELECT {COLUMNS} FROM genomes ORDER BY fitness DESC, id DESC LIMIT ?", (count,)
+        )
+        return [self._record(row) for row in cursor]
+
+    def by_clan(self, clan: int, run: int = None) -> List[dict]:
+        """Метод возвращает все геномы клана одного запуска.
+
+        Args:
+            clan (int): Номер клана
+            run (int, optional): Номер запуска, None - последний запуск архива. Defaults to None.
+
+        Returns:
+            List[dict]: Записи архива, от самой приспособленной.
+        """
+        if run is None:
+            run = self.last_run()
+        cursor = self._connection.execute(
+            f"SELECT {COLUMNS} FROM genomes WHERE run = ? AND clan = ? ORDER BY fitness DESC, id DESC", (run, clan)
+        )
+        return [self._record(row) for row in cursor]
+
+    def runs(self) -> List[int]:
+        """Метод возвращает номера запусков, геномы которых есть в архиве.
+
+        Returns:
+            List[int]: Номера запусков по порядку.
+        """
+        return [row[0] for row in self._connection.execute("SELECT DISTINCT run FROM genomes ORDER BY run")]
+
+    def last_run(self) -> int:
+        """Метод возвращает номер последнего запуска архива, None - если архив пуст."""
+        return self._connection.execute("SELECT MAX(run) FROM genomes").fetchone()[0]
+
+    def best_cells(self, count: int = 2) -> List[Herbivore]:
+        """Метод создает клетки с самыми приспособленными различными геномами.
+
+        Номера кланов уникальны только в пределах одного запуска, поэтому одинаковые записи определяются по весам
+        генома. Результат подходит для World.seed_generation, чтобы начать эволюцию с геномов из архива.
+
+        Args:
+            count (int, optional): Число клеток. Defaults to 2.
+
+        Returns:
+            List[Herbivore]: Клетки, от самой приспособленной.
+        """
+        cells = []
+        genomes = set()
+        cursor = self._connection.execute(f"SELECT {COLUMNS} FROM genomes ORDER BY fitness DESC, id DESC")
+        for row in cursor:
+            genome = row[-2:]
+            if genome in genomes:
+                continue
+            genomes.add(genome)
+            record = self._record(row)
+            cells.append(Herbivore(record["genome"], clan=record["clan"]))
+            if len(cells) == count:
+                break
+        return cells
+
+    def close(self) -> None:
+        """Метод закрывает базу."""
+        self._connection.close()
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM genomes").fetchone()[0]
+
+    @staticmethod
+    def _record(row: tuple) -> dict:
+        record_id, run, epoch, clan, lifetime, fitness, inputs, hidden, outputs, hide_weights, out_weights = row
+        return {
+            "id": record_id,
+            "run": run,
+            "epoch": epoch,
+            "clan": int(clan),
+            "lifetime": lifetime,
+            "fitness": fitness,
+            "genome": [
+                np.frombuffer(hide_weights, dtype=np.float64).reshape(inputs, hidden).copy(),
+                np.frombuffer(out_weights, dtype=np.float64).reshape(hidden, outputs).copy(),
+            ],
+        }
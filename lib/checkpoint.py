@@ -0,0 +1,246 @@
+import json
+import os
+import queue
+import random
+import threading
+from typing import Dict, List
+
+import numpy as np
+
+from cells import PLANT_FOOD, PlantFood
+from cells.genome import Genome
+from cells.live.clans import ClanRegistry
+from cells.live.base import BaseLive
+from cells.live.events import LifeEvents
+from cells.live.herbivore import Herbivore
+from lib.config import WorldConfig
+from lib.index import PositionIndex
+from render import Renderer
+from world import World
+
+CHECKPOINT_VERSION = 4
+
+
+def _stack(arrays: list) -> np.ndarray:
+    """Функция складывает матрицы весов в один массив, пустой список дает пустой массив."""
+    if not arrays:
+        return np.empty((0, 0, 0))
+    return np.stack(arrays)
+
+
+def _pack_cells(prefix: str, cells: List[BaseLive]) -> Dict[str, np.ndarray]:
+    """Функция упаковывает живые клетки в набор массивов.
+
+    Args:
+        prefix (str): Префикс имен массивов
+        cells (List[BaseLive]): Клетки для упаковки
+
+    Returns:
+        Dict[str, np.ndarray]: Массивы с геномом, здоровьем, счетчиками, кланом и цветом клеток.
+    """
+    return {
+        f"{prefix}_hide": _stack([cell.HIDE_WEIGHTS for cell in cells]),
+        f"{prefix}_out": _stack([cell.OUT_WEIGHTS for cell in cells]),
+        f"{prefix}_health": np.array([cell.get_health for cell in cells], dtype=np.int64),
+        f"{prefix}_age": np.array([cell.get_age for cell in cells], dtype=np.int64),
+        f"{prefix}_food": np.array([cell.get_food_eaten for cell in cells], dtype=np.int64),
+        f"{prefix}_clans": np.array([cell.get_clan_name for cell in cells], dtype=np.int64),
+        f"{prefix}_colors": np.array([cell.get_color for cell in cells], dtype=str),
+    }
+
+
+def _unpack_cells(prefix: str, data, events: LifeEvents = None) -> List[Herbivore]:
+    """Функция восстанавливает живые клетки из набора массивов, обратная к _pack_cells."""
+    cells = []
+    genomes: Dict[int, Genome] = {}  # клетки одного клана снова делят один геном
+    for hide, out, health, age, food, clan, color in zip(
+        data[f"{prefix}_hide"],
+        data[f"{prefix}_out"],
+        data[f"{prefix}_health"],
+        data[f"{prefix}_age"],
+        data[f"{prefix}_food"],
+        data[f"{prefix}_clans"],
+        data[f"{prefix}_colors"],
+    ):
+        clan = int(clan)
+        genome = genomes.get(clan)
+        if genome is None:
+            genome = genomes[clan] = Genome(hide, out)
+        cell = Herbivore(genome, int(health), clan, str(color), events=events)
+        cell.AGE = int(age)
+        cell.FOOD_EATEN = int(food)
+        cells.append(cell)
+    return cells
+
+
+def snapshot(world: World) -> Dict[str, np.ndarray]:
+    """Функция делает снимок всего состояния мира в виде набора массивов.
+
+    Снимок содержит копии данных, поэтому мир может продолжать работу, пока снимок записывается на диск.
+
+    Args:
+        world (World): Мир, состояние которого сохраняется
+
+    Returns:
+        Dict[str, np.ndarray]: Массивы, из которых состоит контрольная точка.
+    """
+    positions = world.state.live_positions()
+    live_cells = [world.GRID[i][j] for i, j in positions]
+    grave = world.grave.entries()
+
+    py_version, py_state, py_gauss = random.getstate()
+    np_name, np_keys, np_pos, np_has_gauss, np_gauss = np.random.get_state()
+
+    data = {
+        "version": np.array(CHECKPOINT_VERSION),
+        "config": np.array(json.dumps(world.config.to_dict())),
+        "counters": np.array([world.epoch, world.step, world.total_steps, world.population.total_count]),
+        "history": np.array(world.history, dtype=np.int64).reshape(-1, 2),
+        "types": world.state.types.copy(),
+        "live_positions": np.array(positions, dtype=np.int64).reshape(-1, 2),
+        # выборка свободных мест зависит от порядка позиций в индексе, он сохраняется для точного продолжения
+        "free_positions": np.array(list(world.state.free), dtype=np.int64).reshape(-1, 2),
+        "py_random_state": np.array(py_state, dtype=np.int64),
+        "py_random_meta": np.array([py_version, np.nan if py_gauss is None else py_gauss]),
+        "np_random_keys": np.array(np_keys),
+        "np_random_meta": np.array([np_pos, np_has_gauss, np_gauss]),
+        "np_random_name": np.array(np_name),
+    }
+    data.update(_pack_cells("live", live_cells))
+    data.update(_pack_cells("grave", [cell for _, cell in grave]))
+    # ключи могилы (приспособленность, номер смерти) сохраняются, чтобы порядок лучших клеток не изменился
+    data["grave_keys"] = np.array([key for key, _ in grave], dtype=np.float64).reshape(-1, 2)
+    data["grave_deaths"] = np.array(world.grave.deaths)
+    data.update({f"clans_{name}": array for name, array in world.clans.to_arrays().items()})
+    return data
+
+
+def save_checkpoint(data: Dict[str, np.ndarray], path: str) -> None:
+    """Функция записывает снимок мира на диск.
+
+    Снимок сперва пишется во временный файл, который затем заменяет старый, поэтому прерванная запись не портит
+    предыдущую контрольную точку.
+
+    Args:
+        data (Dict[str, np.ndarray]): Снимок мира, полученный из snapshot
+        path (str): Путь к файлу .npz
+    """
+    tmp_path = f"{path}.tmp.npz"
+    np.savez_compressed(tmp_path, **data)
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path: str, renderer: Renderer) -> World:
+    """Функция восстанавливает мир из контрольной точки.
+
+    Args:
+        path (str): Путь к файлу .npz
+        renderer (Renderer): Отрисовщик, к которому будет подключен восстановленный мир
+
+    Returns:
+        World: Мир, продолжающий работу с того места, где была сделана контрольная точка.
+    """
+    with np.load(path) as data:
+        version = int(data["version"])
+        if version != CHECKPOINT_VERSION:
+            raise ValueError(f"неподдерживаемая версия контрольной точки: {version}")
+
+        world = World(renderer, WorldConfig(**json.loads(str(data["config"]))))
+        world.clans = ClanRegistry.from_arrays(
+            data["clans_parent"], data["clans_co_parent"], data["clans_epoch"], data["clans_origin"]
+        )
+
+        live_cells = _unpack_cells("live", data, world.events)
+        cells = [(int(i), int(j), cell) for (i, j), cell in zip(data["live_positions"], live_cells)]
+        for i, j in zip(*np.nonzero(data["types"] == PlantFood.CODE)):
+            cells.append((int(i), int(j), PLANT_FOOD))
+        world.restore_cells(cells)
+        world.state.free = PositionIndex((int(i), int(j)) for i, j in data["free_positions"])
+        grave_keys = [(float(fitness), int(death)) for fitness, death in data["grave_keys"]]
+        world.grave.restore(list(zip(grave_keys, _unpack_cells("grave", data))), int(data["grave_deaths"]))
+
+        world.epoch, world.step, world.total_steps, population = (int(value) for value in data["counters"])
+        world.population.update_population(population)
+        world.history = [(int(epoch), int(steps)) for epoch, steps in data["history"]]
+
+        py_version, py_gauss = data["py_random_meta"]
+        py_state = tuple(int(value) for value in data["py_random_state"])
+        random.setstate((int(py_version), py_state, None if np.isnan(py_gauss) else float(py_gauss)))
+        np_pos, np_has_gauss, np_gauss = data["np_random_meta"]
+        np.random.set_state(
+            (str(data["np_random_name"]), data["np_random_keys"], int(np_pos), int(np_has_gauss), float(np_gauss))
+        )
+
+    renderer.change_epoch_count(world.epoch)
+    return world
+
+
+class CheckpointWriter:
+    """Класс записывает контрольные точки мира в фоновом потоке, не останавливая цикл шагов.
+
+    Подписывается на завершение эпох мира: каждые every эпох в потоке мира делается быстрый снимок состояния, а
+    сжатие и запись на диск производятся в фоновом потоке.
+
+    Если запись контрольной точки завершилась ошибкой, фоновый поток останавливается, а ошибка выбрасывается из
+    следующего вызова save или close, чтобы симуляция не продолжала работу без контрольных точек.
+    """
+
+    def __init__(self, directory: str, every: int = 1):
+        """
+        Args:
+            directory (str): Каталог, в который записываются контрольные точки
+            every (int, optional): Записывать контрольную точку каждые N эпох. Defaults to 1.
+        """
+        if every < 1:
+            raise ValueError("every должно быть не меньше 1")
+
+        os.makedirs(directory, exist_ok=True)
+        self._directory = directory
+        self._every = every
+        self._queue = queue.Queue()
+        self._error: Exception = None  # ошибка записи в фоновом потоке
+        self._thread = threading.Thread(target=self._write, daemon=True)
+        self._thread.start()
+
+    def end_epoch(self, world: World) -> None:
+        """Метод вызывается миром после завершения эпохи.
+
+        Args:
+            world (World): Мир, завершивший эпоху
+        """
+        finished_epoch = world.epoch - 1
+        if finished_epoch % self._every == 0:
+            self.save(world, os.path.join(self._directory, f"epoch_{finished_epoch:06d}.npz"))
+
+    def save(self, world: World, path: str) -> None:
+        """Метод делает снимок мира и ставит его в очередь на запись.
+
+        Args:
+            world (World): Мир, состояние которого сохраняется
+            path (str): Путь к файлу .npz
+        """
+        self._raise_error()
+        self._queue.put((snapshot(world), path))
+
+    def close(self) -> None:
+        """Метод дожидается записи всех контрольных точек из очереди и останавливает фоновый поток."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        self._raise_error()
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+    def _write(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            try:
+                save_checkpoint(*item)
+            except Exception as error:
+                # снимки, оставшиеся в очереди, уже не будут записаны, очередь отпускается вместе с объектом
+                self._error = error
+                return
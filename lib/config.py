@@ -0,0 +1,92 @@
+from typing import Dict
+
+import settings
+
+
+class WorldConfig:
+    """Класс параметров мира, которые задаются при его создании.
+
+    Каждый мир хранит свои параметры, поэтому в одном процессе могут работать миры разного размера и с разными
+    правилами. Значения по умолчанию берутся из модуля settings.
+    """
+
+    def __init__(
+        self,
+        rows: int = settings.ROW,
+        cols: int = settings.COL,
+        population: int = settings.CELLS_POPULATION,
+        plant_food_count: int = settings.PLANT_FOOD_COUNT,
+        plant_food_refill: int = settings.PLANT_FOOD_REFILL,
+        start_health: int = 25,
+        food_energy: int = 20,
+        mutation_rate: float = 0.1,
+        mutation_delta: float = 0.15,
+        second_mutation_delta: float = 0.4,
+        hidden_neurons: int = 16,
+        grave_size: int = 16,
+        fitness: str = "lifetime",
+        inference: str = "numpy",
+        bulk_arbiter: bool = None,
+    ):
+        """
+        Args:
+            rows (int, optional): Число строк мира. Defaults to settings.ROW.
+            cols (int, optional): Число столбцов мира. Defaults to settings.COL.
+            population (int, optional): Начальная популяция клеток. Defaults to settings.CELLS_POPULATION.
+            plant_food_count (int, optional): Число клеток растительной пищи при создании мира.
+                Defaults to settings.PLANT_FOOD_COUNT.
+            plant_food_refill (int, optional): Число клеток растительной пищи в начале каждой следующей эпохи.
+                Defaults to settings.PLANT_FOOD_REFILL.
+            start_health (int, optional): Здоровье новой клетки. Defaults to 25.
+            food_energy (int, optional): Здоровье, которое клетка получает при поедании пищи. Defaults to 20.
+            mutation_rate (float, optional): Вероятность мутации каждого веса генома. Defaults to 0.1.
+            mutation_delta (float, optional): Величина мутации генома лучшей клетки и ребенка. Defaults to 0.15.
+            second_mutation_delta (float, optional): Величина мутации генома второй лучшей клетки. Defaults to 0.4.
+            hidden_neurons (int, optional): Число нейронов скрытого слоя генома. Defaults to 16.
+            grave_size (int, optional): Число лучших кланов эпохи, которые хранит могила. Defaults to 16.
+            fitness (str, optional): Имя функции приспособленности клеток из lib.population.FITNESS: lifetime -
+                число прожитых шагов, food - число съеденной пищи, last_death - лучшие те, кто умер последними.
+                Defaults to "lifetime".
+            inference (str, optional): Имя движка пакетного вычисления нейронных сетей мира из neural.engine.ENGINES:
+                numpy или numba, если пакет numba установлен. Сеть одной клетки (Herbivore.make_move), которой мир не
+                пользуется, всегда вычисляется движком numpy. Defaults to "numpy".
+            bulk_arbiter (bool, optional): Разрешать действия всех клеток шага сразу через action.bulk.BulkArbiter,
+                False - обходить клетки по одной, None - выбирать на каждом шаге по числу живых клеток, сравнивая его
+                с action.bulk.BULK_MIN_CELLS. Мир из тайлов всегда обходит клетки по одной. Defaults to None.
+        """
+        if rows < 3 or cols < 1:
+            raise ValueError("мир должен содержать хотя бы одну строку между стенами")
+        if not 0 <= mutation_rate <= 1:
+            raise ValueError("mutation_rate должно быть в диапазоне от 0 до 1")
+        if hidden_neurons < 1:
+            raise ValueError("hidden_neurons должно быть не меньше 1")
+        if grave_size < 2:
+            raise ValueError("grave_size должно быть не меньше 2, новое поколение строится из двух лучших кланов")
+
+        self.rows = rows
+        self.cols = cols
+        self.population = population
+        self.plant_food_count = plant_food_count
+        self.plant_food_refill = plant_food_refill
+        self.start_health = start_health
+        self.food_energy = food_energy
+        self.mutation_rate = mutation_rate
+        self.mutation_delta = mutation_delta
+        self.second_mutation_delta = second_mutation_delta
+        self.hidden_neurons = hidden_neurons
+        self.grave_size = grave_size
+        self.fitness = fitness
+        self.inference = inference
+        self.bulk_arbiter = bulk_arbiter
+
+    def to_dict(self) -> Dict[str, float]:
+        """Метод возвращает параметры мира в виде словаря, из которого конфигурацию можно создать заново.
+
+        Returns:
+            Dict[str, float]: Параметры мира.
+        """
+        return dict(vars(self))
+
+    def __repr__(self):
+        params = ", ".join(f"{name}={value}" for name, value in vars(self).items())
+        return f"{self.__class__.__name__}({params})"
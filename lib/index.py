@@ -0,0 +1,82 @@
+import random
+from typing import Iterable, Iterator, List, Tuple
+
+Position = Tuple[int, int]
+
+
+class PositionIndex:
+    """Индекс координат ячеек мира, поддерживающий добавление, удаление и случайную выборку за O(1).
+
+    Позиции хранятся в плотном списке, а словарь хранит место каждой позиции в этом списке. При удалении на место
+    удаляемой позиции переносится последняя, поэтому список не содержит дыр.
+    """
+
+    __slots__ = ("_positions", "_slots")
+
+    def __init__(self, positions: Iterable[Position] = ()):
+        """
+        Args:
+            positions (Iterable[Position], optional): Начальные позиции, их порядок сохраняется. Defaults to ().
+        """
+        self._positions: List[Position] = []
+        self._slots = {}
+        for position in positions:
+            self.add(position)
+
+    def add(self, position: Position) -> None:
+        """Метод добавляет позицию в индекс, если ее там еще нет.
+
+        Args:
+            position (Position): Координаты (y, x) ячейки
+        """
+        if position not in self._slots:
+            self._slots[position] = len(self._positions)
+            self._positions.append(position)
+
+    def discard(self, position: Position) -> None:
+        """Метод удаляет позицию из индекса, если она там есть.
+
+        Args:
+            position (Position): Координаты (y, x) ячейки
+        """
+        slot = self._slots.pop(position, None)
+        if slot is None:
+            return
+
+        last = self._positions.pop()
+        if slot < len(self._positions):
+            self._positions[slot] = last
+            self._slots[last] = slot
+
+    def sample(self, count: int) -> List[Position]:
+        """Метод возвращает случайные различные позиции из индекса.
+
+        Args:
+            count (int): Число позиций, не больше размера индекса
+
+        Returns:
+            List[Position]: Список случайных координат (y, x).
+        """
+        return random.sample(self._positions, count)
+
+    def clear(self) -> None:
+        """Метод очищает индекс."""
+        self._positions = []
+        self._slots = {}
+
+    def ordered(self) -> List[Position]:
+        """Метод возвращает позиции, упорядоченные построчно, в порядке обхода мира.
+
+        Returns:
+            List[Position]: Отсортированный список координат (y, x).
+        """
+        return sorted(self._positions)
+
+    def __contains__(self, position: Position) -> bool:
+        return position in self._slots
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __iter__(self) -> Iterator[Position]:
+        return iter(self._positions)
@@ -0,0 +1,139 @@
+import random
+from multiprocessing import Pool
+from typing import List, Tuple
+
+import numpy as np
+
+from cells.live.herbivore import Herbivore
+from lib.config import WorldConfig
+from render import HeadlessRenderer
+from world import World
+
+IslandResult = Tuple[List[Tuple[int, int]], List[Herbivore]]
+
+
+def run_island(seed: int, best_cells: List[Herbivore], epochs: int, config: WorldConfig = None) -> IslandResult:
+    """Функция прогоняет один остров заданное число эпох без отрисовки.
+
+    Выполняется в процессе пула, поэтому мир каждый раз создается заново: все состояние острова между
+    миграциями - это две лучшие клетки последней эпохи, из которых все равно строится каждое новое поколение.
+
+    Args:
+        seed (int): Зерно генераторов случайных чисел для этого прогона
+        best_cells (List[Herbivore]): Две лучшие клетки, с которых начинается эволюция, None - случайные геномы
+        epochs (int): Число эпох, которые нужно прогнать
+        config (WorldConfig, optional): Параметры мира острова, None - параметры по умолчанию. Defaults to None.
+
+    Returns:
+        IslandResult: Пары (эпоха, число шагов) для каждой эпохи прогона и две лучшие клетки последней эпохи.
+    """
+    random.seed(seed)
+    np.random.seed(seed)
+
+    world = World(HeadlessRenderer(), config)
+    if best_cells is not None:
+        world.seed_generation(best_cells)
+    world.execute(epochs=epochs)
+    return world.history, world.best_cells
+
+
+class IslandModel:
+    """Класс запускает эволюцию по модели островов на всех ядрах машины.
+
+    Каждый остров - независимый мир без отрисовки, острова прогоняются параллельно в пуле процессов. Каждые
+    epochs_per_migration эпох острова обмениваются лучшими геномами по кольцу: остров получает лучшую клетку
+    предыдущего острова вместо своей второй лучшей клетки.
+    """
+
+    def __init__(
+        self,
+        islands: int = 4,
+        epochs_per_migration: int = 5,
+        processes: int = None,
+        seed: int = None,
+        config: WorldConfig = None,
+    ):
+        """
+        Args:
+            islands (int, optional): Число островов. Defaults to 4.
+            epochs_per_migration (int, optional): Число эпох между миграциями. Defaults to 5.
+            processes (int, optional): Число процессов пула, None - по числу ядер. Defaults to None.
+            seed (int, optional): Зерно генератора, делает прогон воспроизводимым. Defaults to None.
+            config (WorldConfig, optional): Параметры миров островов. Defaults to None.
+        """
+        if islands < 1:
+            raise ValueError("islands должно быть не меньше 1")
+        if epochs_per_migration < 1:
+            raise ValueError("epochs_per_migration должно быть не меньше 1")
+
+        self.islands = islands
+        self.epochs_per_migration = epochs_per_migration
+        self._processes = processes
+        self._random = random.Random(seed)
+        self._config = config
+        self.best_cells: List[List[Herbivore]] = [None] * islands  # лучшие клетки каждого острова
+
+    def run(self, epochs: int) -> List[dict]:
+        """Метод прогоняет все острова заданное число эпох.
+
+        Args:
+            epochs (int): Число эпох, которые должен пройти каждый остров
+
+        Returns:
+            List[dict]: Итоги каждой эпохи по всем островам: номер эпохи, число шагов на каждом острове, среднее и
+                максимальное число шагов.
+        """
+        results = []
+        done = 0
+
+        with Pool(self._processes) as pool:
+            while done < epochs:
+                round_epochs = min(self.epochs_per_migration, epochs - done)
+                tasks = [
+                    (self._random.getrandbits(32), self.best_cells[island], round_epochs, self._config)
+                    for island in range(self.islands)
+                ]
+                islands_results = pool.starmap(run_island, tasks)
+
+                results.extend(self._aggregate(done, [history for history, _ in islands_results]))
+                self.best_cells = self._migrate([best for _, best in islands_results])
+                done += round_epochs
+
+        return results
+
+    @staticmethod
+    def _aggregate(offset: int, histories: List[List[Tuple[int, int]]]) -> List[dict]:
+        """Метод сводит итоги эпох всех островов.
+
+        Args:
+            offset (int): Число эпох, пройденных до этого прогона
+            histories (List[List[Tuple[int, int]]]): Пары (эпоха, число шагов) каждого острова
+
+        Returns:
+            List[dict]: Итоги эпох по всем островам.
+        """
+        results = []
+        for epoch_results in zip(*histories):
+            steps = [epoch_steps for _, epoch_steps in epoch_results]
+            results.append(
+                {
+                    "epoch": offset + epoch_results[0][0],
+                    "steps": steps,
+                    "mean_steps": sum(steps) / len(steps),
+                    "max_steps": max(steps),
+                }
+            )
+        return results
+
+    def _migrate(self, best_cells: List[List[Herbivore]]) -> List[List[Herbivore]]:
+        """Метод производит миграцию лучших клеток между островами по кольцу.
+
+        Args:
+            best_cells (List[List[Herbivore]]): Две лучшие клетки каждого острова
+
+        Returns:
+            List[List[Herbivore]]: Две лучшие клетки каждого острова после миграции.
+        """
+        if self.islands == 1:
+            return best_cells
+        return [[best_cells[island][0], best_cells[island - 1][0]] for island in range(self.islands)]
@@ -1,3 +1,6 @@
+import heapq
+from typing import Callable, Dict, List, Tuple
+
 from cells.live.base import BaseLive
 
 
@@ -19,13 +22,13 @@ class Population:
         """Метод производит сброс популяции мира в нуль."""
         self.total_count = 0
 
-    def update_population(self, world: list) -> None:
-        """Метод для установления новой популяции мира."""
-        self.clear_population()
-        for line in world:
-            for cell in line:
-                if isinstance(cell, BaseLive):
-                    self.new_cell()
+    def update_population(self, count: int) -> None:
+        """Метод для установления новой популяции мира.
+
+        Args:
+            count (int): Число живых клеток в мире.
+        """
+        self.total_count = count
 
     @property
     def world_is_extinct(self) -> bool:
@@ -37,28 +40,121 @@ class Population:
         return self.total_count <= 0
 
 
+def lifetime_fitness(cell: BaseLive) -> float:
+    """Приспособленность клетки - число прожитых шагов."""
+    return cell.get_age
+
+
+def food_fitness(cell: BaseLive) -> float:
+    """Приспособленность клетки - число съеденной пищи."""
+    return cell.get_food_eaten
+
+
+def last_death_fitness(cell: BaseLive) -> float:
+    """Приспособленность всех клеток одинакова, поэтому лучшими считаются клетки, умершие последними."""
+    return 0
+
+
+# функции приспособленности по именам, под которыми они задаются в параметрах мира
+FITNESS: Dict[str, Callable[[BaseLive], float]] = {
+    "lifetime": lifetime_fitness,
+    "food": food_fitness,
+    "last_death": last_death_fitness,
+}
+
+GraveKey = Tuple[float, int]
+
+
 class Grave:
-    """Класс могила хранит в себе все умершие клетки."""
+    """Класс могила хранит лучшие умершие клетки эпохи.
+
+    Для каждого клана хранится только его самая приспособленная клетка, а всего хранится не больше size кланов,
+    поэтому память могилы не растет с числом смертей. Клетки упорядочены по ключу (приспособленность, номер смерти):
+    при равной приспособленности лучше клетка, умершая позже. Кланы хранятся в куче с наименее приспособленным на
+    вершине, поэтому обработка смерти стоит O(log size).
+    """
+
+    def __init__(self, size: int = 16, fitness: Callable[[BaseLive], float] = lifetime_fitness):
+        """
+        Args:
+            size (int, optional): Максимальное число хранимых кланов. Defaults to 16.
+            fitness (Callable[[BaseLive], float], optional): Функция приспособленности клетки.
+                Defaults to lifetime_fitness.
+        """
+        if size < 1:
+            raise ValueError("size должно быть не меньше 1")
 
-    def __init__(self):
-        self.grave = []
+        self.size = size
+        self.fitness = fitness
+        # элементы кучи [ключ, клан, клетка], у вытесненных лучшей клеткой того же клана элементов клетка None
+        self._heap: List[list] = []
+        self._clans: Dict[int, list] = {}  # актуальный элемент кучи каждого клана
+        self._deaths = 0  # число смертей, номер смерти разрешает равенство приспособленности
 
     def die_cell(self, *args) -> None:
         """Общий интерфейс, который вызывается внутри объекта, но который производится подписка."""
         cell: BaseLive = args[0]
-        self.grave.append(cell)
+        self._deaths += 1
+        self._push((self.fitness(cell), self._deaths), cell)
+
+    def _push(self, key: GraveKey, cell: BaseLive) -> None:
+        clan = cell.get_clan_name
+        entry = self._clans.get(clan)
+        if entry is not None:
+            if key <= entry[0]:
+                return
+            # старый элемент остается в куче до тех пор, пока не окажется на ее вершине
+            entry[2] = None
+        elif len(self._clans) >= self.size:
+            self._drop_replaced()
+            if key <= self._heap[0][0]:
+                return
+            _, worst_clan, _ = heapq.heappop(self._heap)
+            del self._clans[worst_clan]
+
+        entry = [key, clan, cell]
+        self._clans[clan] = entry
+        heapq.heappush(self._heap, entry)
+        # вытесненных элементов не может стать больше, чем актуальных
+        if len(self._heap) > 2 * self.size:
+            self._heap = list(self._clans.values())
+            heapq.heapify(self._heap)
+
+    def _drop_replaced(self) -> None:
+        """Метод убирает с вершины кучи элементы, вытесненные лучшими клетками тех же кланов."""
+        while self._heap[0][2] is None:
+            heapq.heappop(self._heap)
 
     def clear(self) -> None:
         """Метод очищает могилы."""
-        self.grave = []
+        self._heap = []
+        self._clans = {}
+        self._deaths = 0
+
+    def entries(self) -> List[Tuple[GraveKey, BaseLive]]:
+        """Метод возвращает хранимые клетки с их ключами.
 
-    def get_best(self, uniq_count: int = 2) -> None:
-        """Метод производит получение лучших уникальных клеток из всех мертвых."""
-        bests = [self.grave.pop()]
+        Returns:
+            List[Tuple[GraveKey, BaseLive]]: Пары (ключ, клетка), от самой приспособленной клетки.
+        """
+        return sorted(((entry[0], entry[2]) for entry in self._clans.values()), key=lambda item: item[0], reverse=True)
+
+    def restore(self, entries: List[Tuple[GraveKey, BaseLive]], deaths: int) -> None:
+        """Метод восстанавливает могилу, например, из контрольной точки.
 
-        while len(bests) < uniq_count:
-            dead_cell = self.grave.pop()
-            if dead_cell.get_clan_name != bests[0].get_clan_name:
-                bests.append(dead_cell)
+        Args:
+            entries (List[Tuple[GraveKey, BaseLive]]): Пары (ключ, клетка), полученные из entries
+            deaths (int): Число смертей на момент сохранения
+        """
+        self.clear()
+        for key, cell in entries:
+            self._push(key, cell)
+        self._deaths = deaths
+
+    @property
+    def deaths(self) -> int:
+        return self._deaths
 
-        return bests.copy()
+    def get_best(self, uniq_count: int = 2) -> List[BaseLive]:
+        """Метод производит получение лучших клеток разных кланов из всех мертвых."""
+        return [cell for _, cell in self.entries()[:uniq_count]]
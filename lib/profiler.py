@@ -0,0 +1,117 @@
+import time
+from typing import Callable, Dict, List
+
+PHASES = ("copy", "sensing", "inference", "arbitration", "update", "render")
+COUNTERS = ("cells", "moves", "bites", "divisions", "deaths")
+
+
+def _empty() -> Dict[str, float]:
+    record = dict.fromkeys(PHASES, 0.0)
+    record.update(dict.fromkeys(COUNTERS, 0))
+    record["steps"] = 0
+    return record
+
+
+def _accumulate(total: Dict[str, float], record: Dict[str, float]) -> None:
+    for key, value in record.items():
+        total[key] += value
+
+
+class StepProfiler:
+    """Класс собирает время фаз шага мира и счетчики событий, сводя их по шагам и по эпохам.
+
+    Фазы шага: copy - синхронизация буфера мира, sensing - сбор входных значений, inference - вычисление нейронных
+    сетей, arbitration - обработка действий арбитером, update - применение изменений или перезапуск мира в конце
+    эпохи, render - отрисовка. Счетчики: cells - число сходивших клеток, moves - шаги, bites - удачные укусы,
+    divisions - деления, deaths - смерти.
+
+    Мир обращается к профилировщику только если он установлен, поэтому выключенный профилировщик ничего не стоит.
+    """
+
+    def __init__(self, summary_every: int = None, output: Callable[[str], None] = print):
+        """
+        Args:
+            summary_every (int, optional): Печатать сводку каждые N шагов, None - не печатать. Defaults to None.
+            output (Callable[[str], None], optional): Функция вывода сводки. Defaults to print.
+        """
+        self._summary_every = summary_every
+        self._output = output
+        self._step = _empty()
+        self._window = _empty()  # накопленные значения с момента последней сводки
+        self.last_step = _empty()  # значения последнего завершенного шага
+        self.epoch = _empty()  # накопленные значения текущей эпохи
+        self.epochs: List[Dict[str, float]] = []  # значения всех завершенных эпох
+        self.total = _empty()  # значения за все время работы
+
+    def start(self) -> float:
+        """Метод начинает замер нового шага.
+
+        Returns:
+            float: Отметка времени начала первой фазы.
+        """
+        self._step = _empty()
+        return time.perf_counter()
+
+    def lap(self, phase: str, started: float) -> float:
+        """Метод завершает фазу шага и записывает ее время.
+
+        Args:
+            phase (str): Название фазы
+            started (float): Отметка времени начала фазы
+
+        Returns:
+            float: Отметка времени окончания фазы, она же начало следующей.
+        """
+        now = time.perf_counter()
+        self._step[phase] += now - started
+        return now
+
+    def end_step(self, counters: Dict[str, int], epoch: int, is_end_epoch: bool) -> None:
+        """Метод завершает замер шага.
+
+        Args:
+            counters (Dict[str, int]): Значения счетчиков за шаг
+            epoch (int): Номер эпохи, к которой относится шаг
+            is_end_epoch (bool): True если шаг завершил эпоху
+        """
+        self._step.update(counters)
+        self._step["steps"] = 1
+        self.last_step = self._step
+        for total in (self._window, self.epoch, self.total):
+            _accumulate(total, self._step)
+
+        if is_end_epoch:
+            self.epoch["epoch"] = epoch
+            self.epochs.append(self.epoch)
+            self.epoch = _empty()
+
+        if self._summary_every is not None and self.total["steps"] % self._summary_every == 0:
+            self._output(self.summary(self._window))
+            self._window = _empty()
+
+    def add(self, phase: str, seconds: float) -> None:
+        """Метод добавляет время фазы, которая выполняется вне шага мира, например отрисовки.
+
+        Время относится к последнему завершенному шагу.
+
+        Args:
+            phase (str): Название фазы
+            seconds (float): Время фазы в секундах
+        """
+        for record in (self.last_step, self._window, self.epoch, self.total):
+            record[phase] += seconds
+
+    @staticmethod
+    def summary(record: Dict[str, float]) -> str:
+        """Метод формирует строку со средними значениями фаз и счетчиков на шаг.
+
+        Args:
+            record (Dict[str, float]): Накопленные значения
+
+        Returns:
+            str: Строка сводки.
+        """
+        steps = max(record["steps"], 1)
+        phases = " ".join(f"{phase}={record[phase] / steps * 1000:.3f}ms" for phase in PHASES)
+        counters = " ".join(f"{counter}={record[counter] / steps:.1f}" for counter in COUNTERS)
+        return f"steps={record['steps']} | {phases} | {counters}"
@@ -0,0 +1,259 @@
+import struct
+from typing import BinaryIO, Dict, List, Set, Tuple
+
+import numpy as np
+
+import settings
+from cells.live.herbivore import Herbivore
+from render import RenderCadence, Renderer
+from world import World
+
+MAGIC = b"EVOREPL1"
+FILE_HEADER = struct.Struct("<8sHH")  # сигнатура, число строк и число столбцов мира
+RECORD_HEADER = struct.Struct("<iiqBHI")  # эпоха, шаг, общий шаг, вид записи, число цветов, число ячеек
+COLOR_LENGTH = struct.Struct("<B")
+
+DELTA = 0
+KEYFRAME = 1
+
+DELTA_DTYPE = np.dtype([("row", "<u2"), ("col", "<u2"), ("type", "i1"), ("color", "u1")])
+INDEX_DTYPE = np.dtype(
+    [("epoch", "<i4"), ("step", "<i4"), ("total_step", "<i8"), ("offset", "<i8"), ("keyframe", "i1")]
+)
+
+
+def _index_path(path: str) -> str:
+    return f"{path}.idx"
+
+
+class ReplayRecorder:
+    """Класс записывает ход симуляции для последующего просмотра без повторного прогона мира.
+
+    После каждого шага в файл дописываются только изменившиеся ячейки (их тип и цвет), а каждые keyframe_every
+    шагов и при смене эпохи - полное состояние мира (ключевой кадр). Для каждого шага в отдельный файл индекса
+    дописывается смещение его записи, по которому проигрыватель находит ближайший ключевой кадр.
+
+    Цвета хранятся индексами в палитре. Ключевой кадр содержит всю палитру, а запись изменений только новые цвета,
+    поэтому любой ключевой кадр можно прочитать без чтения файла с начала.
+    """
+
+    def __init__(self, path: str, keyframe_every: int = 500):
+        """
+        Args:
+            path (str): Путь к файлу записи, рядом создается файл индекса с расширением .idx
+            keyframe_every (int, optional): Число шагов между ключевыми кадрами. Defaults to 500.
+        """
+        if keyframe_every < 1:
+            raise ValueError("keyframe_every должно быть не меньше 1")
+
+        self._path = path
+        self._keyframe_every = keyframe_every
+        self._palette: Dict[str, int] = {}
+        self._since_keyframe = 0
+        self._epoch = None
+        self._data: BinaryIO = None
+        self._index: BinaryIO = None
+
+    def attach(self, world: World) -> None:
+        """Метод начинает запись мира: записывает текущее состояние ключевым кадром и подписывается на шаги.
+
+        Args:
+            world (World): Мир, который нужно записывать
+        """
+        rows, cols = world.state.types.shape
+        self._data = open(self._path, "wb")
+        self._index = open(_index_path(self._path), "wb")
+        self._data.write(FILE_HEADER.pack(MAGIC, rows, cols))
+
+        self._write_keyframe(world)
+        world.add_step_sub(self)
+
+    def end_step(self, world: World, changes: Set[Tuple[int, int]]) -> None:
+        """Метод вызывается миром после каждого шага.
+
+        Args:
+            world (World): Мир, завершивший шаг
+            changes (Set[Tuple[int, int]]): Координаты (y, x) изменившихся ячеек
+        """
+        self._since_keyframe += 1
+        # при смене эпохи мир меняется целиком, поэтому запись изменений не меньше ключевого кадра
+        if self._since_keyframe >= self._keyframe_every or world.epoch != self._epoch:
+            self._write_keyframe(world)
+        else:
+            self._write_delta(world, changes)
+
+    def close(self) -> None:
+        """Метод закрывает файлы записи."""
+        if self._data is not None:
+            self._data.close()
+            self._index.close()
+            self._data = self._index = None
+
+    def _color_index(self, color: str, new_colors: List[str]) -> int:
+        index = self._palette.get(color)
+        if index is None:
+            index = self._palette[color] = len(self._palette)
+            new_colors.append(color)
+        return index
+
+    def _write_record(self, world: World, kind: int, colors: List[str], count: int, payload: bytes) -> None:
+        offset = self._data.tell()
+        self._data.write(RECORD_HEADER.pack(world.epoch, world.step, world.total_steps, kind, len(colors), count))
+        for color in colors:
+            encoded = color.encode()
+            self._data.write(COLOR_LENGTH.pack(len(encoded)))
+            self._data.write(encoded)
+        self._data.write(payload)
+
+        index = np.array([(world.epoch, world.step, world.total_steps, offset, kind == KEYFRAME)], dtype=INDEX_DTYPE)
+        self._index.write(index.tobytes())
+
+    def _write_keyframe(self, world: World) -> None:
+        new_colors = []
+        colors = np.array(
+            [[self._color_index(cell.get_color, new_colors) for cell in row] for row in world.GRID], dtype=np.uint8
+        )
+        payload = world.state.types.astype(np.int8).tobytes() + colors.tobytes()
+        self._write_record(world, KEYFRAME, list(self._palette), colors.size, payload)
+
+        self._since_keyframe = 0
+        self._epoch = world.epoch
+
+    def _write_delta(self, world: World, changes: Set[Tuple[int, int]]) -> None:
+        new_colors = []
+        deltas = np.array(
+            [
+                (i, j, world.state.types[i, j], self._color_index(world.GRID[i][j].get_color, new_colors))
+                for i, j in changes
+            ],
+            dtype=DELTA_DTYPE,
+        )
+        self._write_record(world, DELTA, new_colors, len(deltas), deltas.tobytes())
+
+
+class ReplayPlayer:
+    """Класс проигрывает запись симуляции, сделанную ReplayRecorder.
+
+    Нейронные сети при проигрывании не вычисляются, состояние мира на любом шаге восстанавливается из ближайшего
+    предшествующего ключевого кадра и записанных после него изменений.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): Путь к файлу записи
+        """
+        self._path = path
+        self.index = np.fromfile(_index_path(path), dtype=INDEX_DTYPE)
+        with open(path, "rb") as data:
+            magic, self.rows, self.cols = FILE_HEADER.unpack(data.read(FILE_HEADER.size))
+        if magic != MAGIC:
+            raise ValueError(f"{path} не является файлом записи симуляции")
+
+        self.types: np.ndarray = None  # коды типов ячеек на текущем шаге
+        self.colors: np.ndarray = None  # индексы цветов ячеек на текущем шаге
+        self.palette: List[str] = []
+        self._position = -1  # номер текущей записи в индексе
+
+    def find(self, epoch: int, step: int = None) -> int:
+        """Метод ищет номер записи для заданного шага эпохи.
+
+        Args:
+            epoch (int): Номер эпохи
+            step (int, optional): Шаг эпохи, None - первый записанный шаг эпохи. Defaults to None.
+
+        Returns:
+            int: Номер записи в индексе.
+        """
+        matches = self.index["epoch"] == epoch
+        if step is not None:
+            matches &= self.index["step"] == step
+        found = np.flatnonzero(matches)
+        if not len(found):
+            raise KeyError(f"в записи нет эпохи {epoch} и шага {step}")
+        return int(found[0])
+
+    def seek(self, position: int) -> None:
+        """Метод восстанавливает состояние мира на заданной записи.
+
+        Args:
+            position (int): Номер записи в индексе
+        """
+        keyframes = np.flatnonzero(self.index["keyframe"][: position + 1])
+        start = int(keyframes[-1])
+        # если текущая запись лежит между ключевым кадром и целевой, продолжаем с нее
+        if start <= self._position <= position:
+            start = self._position + 1
+
+        with open(self._path, "rb") as data:
+            for record in range(start, position + 1):
+                data.seek(int(self.index["offset"][record]))
+                self._read_record(data)
+        self._position = position
+
+    def play(self, renderer: Renderer, start: int = 0, stop: int = None, cadence: RenderCadence = None) -> None:
+        """Метод проигрывает запись на переданном отрисовщике.
+
+        Args:
+            renderer (Renderer): Отрисовщик, на котором проигрывается запись
+            start (int, optional): Номер записи, с которой начинается проигрывание. Defaults to 0.
+            stop (int, optional): Номер записи, на которой проигрывание останавливается, None - до конца.
+                Defaults to None.
+            cadence (RenderCadence, optional): Частота отрисовки, по умолчанию каждый шаг. Defaults to None.
+        """
+        if cadence is None:
+            cadence = RenderCadence()
+        if stop is None:
+            stop = len(self.index) - 1
+
+        map_ids = self._create_map(renderer)
+        self.seek(start)
+        painted = np.full_like(self.colors, -1, dtype=np.int16)
+
+        with open(self._path, "rb") as data:
+            for position in range(start, stop + 1):
+                if position > start:
+                    data.seek(int(self.index["offset"][position]))
+                    self._read_record(data)
+                    self._position = position
+
+                epoch_changed = position > start and self.index["epoch"][position] != self.index["epoch"][position - 1]
+                if position == stop or cadence.should_render(epoch_changed):
+                    painted = self._render(renderer, map_ids, painted, position)
+
+    def _render(self, renderer: Renderer, map_ids: np.ndarray, painted: np.ndarray, position: int) -> np.ndarray:
+        for i, j in zip(*np.nonzero(painted != self.colors)):
+            renderer.change_cell_color(int(map_ids[i, j]), self.palette[self.colors[i, j]])
+
+        renderer.change_cells_count(int(np.count_nonzero(self.types == Herbivore.CODE)))
+        renderer.change_epoch_count(int(self.index["epoch"][position]))
+        renderer.change_steps_count(int(self.index["step"][position]))
+        renderer.update()
+        return self.colors.astype(np.int16)
+
+    def _create_map(self, renderer: Renderer) -> np.ndarray:
+        map_ids = np.empty((self.rows, self.cols), dtype=np.int64)
+        for i in range(self.rows):
+            for j in range(self.cols):
+                x1 = j * settings.CELL_X
+                y1 = i * settings.CELL_Y
+                map_ids[i, j] = renderer.create_rectangle(x1, y1, x1 + settings.CELL_X, y1 + settings.CELL_Y)
+        return map_ids
+
+    def _read_record(self, data: BinaryIO) -> None:
+        _, _, _, kind, colors_count, count = RECORD_HEADER.unpack(data.read(RECORD_HEADER.size))
+
+        colors = []
+        for _ in range(colors_count):
+            (length,) = COLOR_LENGTH.unpack(data.read(COLOR_LENGTH.size))
+            colors.append(data.read(length).decode())
+
+        if kind == KEYFRAME:
+            self.palette = colors
+            self.types = np.frombuffer(data.read(count), dtype=np.int8).reshape(self.rows, self.cols).copy()
+            self.colors = np.frombuffer(data.read(count), dtype=np.uint8).reshape(self.rows, self.cols).copy()
+        else:
+            self.palette.extend(colors)
+            deltas = np.frombuffer(data.read(count * DELTA_DTYPE.itemsize), dtype=DELTA_DTYPE)
+            self.types[deltas["row"], deltas["col"]] = deltas["type"]
+            self.colors[deltas["row"], deltas["col"]] = deltas["color"]
@@ -0,0 +1,208 @@
+import csv
+import itertools
+import random
+import time
+from multiprocessing import Pool
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+from lib.config import WorldConfig
+from render import HeadlessRenderer
+from world import World
+
+# параметр сетки, который задает сразу начальное количество пищи и количество пищи в каждой следующей эпохе
+FOOD = "food"
+
+SweepTask = Tuple[int, Dict[str, float], int, int, int]
+
+
+def make_config(params: Dict[str, float]) -> WorldConfig:
+    """Функция создает параметры мира для одной точки сетки.
+
+    Args:
+        params (Dict[str, float]): Значения параметров WorldConfig, параметр food задает сразу plant_food_count и
+            plant_food_refill
+
+    Returns:
+        WorldConfig: Параметры мира.
+    """
+    params = dict(params)
+    if FOOD in params:
+        food = params.pop(FOOD)
+        params.setdefault("plant_food_count", food)
+        params.setdefault("plant_food_refill", food)
+    return WorldConfig(**params)
+
+
+def parse_grid(items: Sequence[str]) -> Dict[str, List[float]]:
+    """Функция разбирает сетку параметров из строк вида ИМЯ=ЗНАЧЕНИЕ,ЗНАЧЕНИЕ.
+
+    Args:
+        items (Sequence[str]): Строки с параметрами, например ["food=150,300", "mutation_delta=0.1,0.3"]
+
+    Returns:
+        Dict[str, List[float]]: Значения каждого параметра, целые числа остаются целыми.
+    """
+    grid = {}
+    for item in items:
+        name, sep, values = item.partition("=")
+        if not sep or not name or not values:
+            raise ValueError(f"параметр сетки должен иметь вид ИМЯ=ЗНАЧЕНИЕ,ЗНАЧЕНИЕ: {item}")
+        grid[name] = [_parse_value(value) for value in values.split(",")]
+    return grid
+
+
+def _parse_value(value: str) -> float:
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+
+class _LifetimeTracker:
+    """Подписчик на завершение эпохи, запоминает самую долгую жизнь среди лучших клеток эпох."""
+
+    def __init__(self):
+        self.best_lifetime = 0
+
+    def end_epoch(self, world: World) -> None:
+        for cell in world.best_cells:
+            self.best_lifetime = max(self.best_lifetime, cell.get_age)
+
+
+def run_sweep_point(run: int, params: Dict[str, float], seed: int, epochs: int, steps: int) -> dict:
+    """Функция прогоняет мир без отрисовки для одной точки сетки, вызывается в процессе пула.
+
+    Args:
+        run (int): Номер прогона в сетке
+        params (Dict[str, float]): Значения параметров мира
+        seed (int): Зерно генераторов случайных чисел
+        epochs (int): Число эпох, после которых прогон останавливается, None - без ограничения
+        steps (int): Общее число шагов, после которых прогон останавливается, None - без ограничения
+
+    Returns:
+        dict: Итоги прогона: параметры, число пройденных эпох, среднее число шагов в эпохе и самая долгая жизнь
+            лучшей клетки эпохи.
+    """
+    random.seed(seed)
+    np.random.seed(seed)
+
+    world = World(HeadlessRenderer(), make_config(params))
+    tracker = _LifetimeTracker()
+    world.add_epoch_sub(tracker)
+
+    start = time.perf_counter()
+    world.execute(epochs=epochs, steps=steps)
+    elapsed = time.perf_counter() - start
+
+    epoch_steps = [count for _, count in world.history]
+    return {
+        "run": run,
+        "seed": seed,
+        **params,
+        "epochs": len(epoch_steps),
+        "steps": world.total_steps,
+        "mean_steps": sum(epoch_steps) / len(epoch_steps) if epoch_steps else 0.0,
+        "best_lifetime": tracker.best_lifetime,
+        "seconds": elapsed,
+    }
+
+
+class ParameterSweep:
+    """Класс прогоняет мир без отрисовки на сетке параметров в пуле процессов.
+
+    Каждая точка декартова произведения значений параметров прогоняется с каждым из зерен, поэтому прогоны
+    воспроизводимы. Итоги прогонов записываются в CSV по мере их завершения, не дожидаясь конца всей сетки. Прогон,
+    завершившийся ошибкой, записывается с текстом ошибки в столбце error.
+    """
+
+    def __init__(
+        self,
+        grid: Dict[str, Sequence[float]],
+        seeds: Sequence[int] = (0,),
+        epochs: int = None,
+        steps: int = None,
+        processes: int = None,
+    ):
+        """
+        Args:
+            grid (Dict[str, Sequence[float]]): Значения каждого параметра WorldConfig, например population,
+                food_energy, mutation_delta. Параметр food задает сразу plant_food_count и plant_food_refill
+            seeds (Sequence[int], optional): Зерна, с которыми прогоняется каждая точка сетки. Defaults to (0,).
+            epochs (int, optional): Число эпох каждого прогона. Defaults to None.
+            steps (int, optional): Общее число шагов каждого прогона. Defaults to None.
+            processes (int, optional): Число процессов пула, None - по числу ядер. Defaults to None.
+        """
+        if epochs is None and steps is None:
+            raise ValueError("для прогонов сетки нужно указать число эпох или шагов")
+        if not seeds:
+            raise ValueError("для прогонов сетки нужно хотя бы одно зерно")
+
+        self.grid = {name: list(values) for name, values in grid.items()}
+        self.seeds = list(seeds)
+        self.epochs = epochs
+        self.steps = steps
+        self._processes = processes
+        # неизвестные и недопустимые параметры проверяются до запуска пула
+        for params in self.points():
+            make_config(params)
+
+    def points(self) -> List[Dict[str, float]]:
+        """Метод возвращает все точки сетки.
+
+        Returns:
+            List[Dict[str, float]]: Значения параметров в каждой точке.
+        """
+        names = list(self.grid)
+        return [dict(zip(names, values)) for values in itertools.product(*self.grid.values())]
+
+    def tasks(self) -> List[SweepTask]:
+        """Метод возвращает аргументы run_sweep_point для всех прогонов.
+
+        Returns:
+            List[SweepTask]: Номер прогона, параметры, зерно, число эпох и шагов.
+        """
+        runs = itertools.product(self.points(), self.seeds)
+        return [(run, params, seed, self.epochs, self.steps) for run, (params, seed) in enumerate(runs)]
+
+    @property
+    def columns(self) -> List[str]:
+        """Столбцы CSV с итогами прогонов."""
+        return ["run", "seed", *self.grid, "epochs", "steps", "mean_steps", "best_lifetime", "seconds", "error"]
+
+    def run(self) -> Iterator[dict]:
+        """Метод прогоняет все точки сетки.
+
+        Yields:
+            Iterator[dict]: Итоги прогонов в порядке их завершения.
+        """
+        with Pool(self._processes) as pool:
+            yield from pool.imap_unordered(_run_task, self.tasks())
+
+    def run_to_csv(self, path: str) -> Iterator[dict]:
+        """Метод прогоняет все точки сетки и записывает итог каждого прогона в CSV сразу после его завершения.
+
+        Args:
+            path (str): Путь к файлу CSV
+
+        Yields:
+            Iterator[dict]: Итоги прогонов в порядке их завершения, каждый уже записан в файл.
+        """
+        with open(path, "w", newline="") as output:
+            writer = csv.DictWriter(output, fieldnames=self.columns)
+            writer.writeheader()
+            output.flush()
+            for result in self.run():
+                writer.writerow(result)
+                output.flush()
+                yield result
+
+
+def _run_task(task: SweepTask) -> dict:
+    # ошибка одного прогона, например мир, в котором пища не оставила места клеткам, не останавливает всю сетку
+    try:
+        return run_sweep_point(*task)
+    except Exception as error:
+        run, params, seed, _, _ = task
+        return {"run": run, "seed": seed, **params, "error": repr(error)}
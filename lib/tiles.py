@@ -0,0 +1,474 @@
+import pickle
+from multiprocessing import Pipe, Process
+from typing import Dict, FrozenSet, List, Set, Tuple
+
+import numpy as np
+
+from action import BITE, MOVE, HerbArbiter, StepContext
+from cells import EMPTY, BaseCell, PlantFood
+from cells.live.base import BaseLive
+from cells.live.events import LifeEvents
+from cells.live.herbivore import Herbivore
+from lib.config import WorldConfig
+from lib.population import FITNESS, Grave, GraveKey
+from lib.world_state import WorldState
+from neural.batch import BatchNeuralNetwork
+from neural.engine import get_engine
+from render import RenderCadence, Renderer
+from world import World
+
+# запрос соседнему тайлу: вид действия, координаты (x, y) клетки, ячейки-цели (x, y) и клетка
+Request = Tuple[int, Tuple[int, int], List[Tuple[int, int]], BaseLive]
+# ответ на запрос: координаты (x, y) клетки и принято ли действие
+Response = Tuple[Tuple[int, int], bool]
+
+
+def _halo_rows(rows: int, start: int, stop: int) -> FrozenSet[int]:
+    """Функция возвращает строки соседних тайлов, которые видят клетки тайла [start, stop).
+
+    Мир замкнут по кругу, поэтому над первой строкой мира лежит последняя.
+    """
+    return frozenset({(start - 1) % rows, stop % rows}.difference(range(start, stop)))
+
+
+class Tile:
+    """Класс горизонтальной полосы строк мира [start, stop), которую шагает отдельный процесс.
+
+    Тайл хранит клетки только своих строк, а веса ячеек граничных строк соседей (гало) получает перед каждым шагом,
+    чтобы клетки на краю тайла видели мир так же, как в целом мире. Шаг проходит в три этапа:
+
+    1. act - клетки тайла делают ход. Действия со своими ячейками выполняются сразу, в порядке обхода мира, а
+       действия с ячейками соседних тайлов откладываются и возвращаются запросами.
+    2. resolve - тайл разрешает запросы соседей к своим ячейкам после собственных действий, в порядке расположения
+       запрашивающих клеток: шаг и деление в свободную ячейку, укус несъеденной пищи.
+    3. commit - тайл применяет ответы на свои запросы и переносит изменения шага в представление массивами.
+
+    Порядок разрешения не зависит от того, в каком порядке работают процессы, поэтому прогон воспроизводим.
+    """
+
+    def __init__(self, config: WorldConfig, start: int, stop: int):
+        """
+        Args:
+            config (WorldConfig): Параметры мира
+            start (int): Первая строка тайла
+            stop (int): Строка, следующая за последней строкой тайла
+        """
+        self.config = config
+        self.start = start
+        self.stop = stop
+        self.halo = _halo_rows(config.rows, start, stop)
+        # карта тайла имеет высоту всего мира, чтобы координаты и замкнутость мира были такими же, как в целом мире,
+        # строки других тайлов не хранятся
+        self.grid: List[List[BaseCell]] = [None] * config.rows
+        # буфер следующего состояния строк тайла, как у World: карта и буфер меняются ролями после каждого шага
+        self._buffer: List[List[BaseCell]] = [None] * config.rows
+        # координаты ячеек, в которых буфер отстает от карты, None - буфер нужно синхронизировать полностью
+        self._stale: Set[Tuple[int, int]] = None
+        self.state = WorldState(config.rows, config.cols)
+        self.grave = Grave(config.grave_size, FITNESS[config.fitness])
+        self.events = LifeEvents()
+        self.events.add_death_sub(self.grave)
+
+        self._neurons = BatchNeuralNetwork(get_engine(config.inference))
+        self._herb_arbiter = HerbArbiter()
+        self._new_grid: List[List[BaseCell]] = None
+        self._step: StepContext = None
+        self._deferred: Dict[Tuple[int, int], Tuple[int, BaseLive]] = {}  # отложенные действия клеток тайла
+        self._pending = set()  # координаты (y, x) ячеек, изменившихся с последней отрисовки
+
+    def load(self, rows: Dict[int, List[BaseCell]]) -> None:
+        """Метод заселяет тайл строками мира, вызывается в начале каждой эпохи.
+
+        Args:
+            rows (Dict[int, List[BaseCell]]): Строки мира по их номерам
+        """
+        self.state = WorldState(self.config.rows, self.config.cols)
+        self._pending = set()
+        self._stale = None
+        for i, row in rows.items():
+            self.grid[i] = row
+            for j, cell in enumerate(row):
+                if cell.can_move:
+                    cell.events = self.events
+                self.state.set_cell(i, j, cell)
+                # новая эпоха отрисовывается целиком
+                self._pending.add((i, j))
+        self.grave.clear()
+
+    def _begin_update(self) -> List[List[BaseCell]]:
+        """Метод синхронизирует буфер строк тайла с картой, копируются только ссылки на изменившиеся клетки.
+
+        Returns:
+            List[List[BaseCell]]: Матрица, в которую нужно записывать новое состояние тайла.
+        """
+        if self._stale is None:
+            for i in range(self.start, self.stop):
+                self._buffer[i] = list(self.grid[i])
+        else:
+            for i, j in self._stale:
+                self._buffer[i][j] = self.grid[i][j]
+        self._stale = set()
+        return self._buffer
+
+    def act(self, halo_costs: Dict[int, np.ndarray]) -> List[Request]:
+        """Метод делает ход всеми клетками тайла.
+
+        Args:
+            halo_costs (Dict[int, np.ndarray]): Веса ячеек строк гало на начало шага
+
+        Returns:
+            List[Request]: Отложенные действия с ячейками соседних тайлов.
+        """
+        for row, costs in halo_costs.items():
+            self.state.costs[row] = costs
+
+        positions = self.state.live_positions()
+        rows, cols = np.array(positions, dtype=np.intp).reshape(-1, 2).T
+        cells = [self.grid[i][j] for i, j in positions]
+        self.state.update_health(rows, cols, cells)
+        inputs = self.state.sense(rows, cols)
+        moves = self._neurons.compute_cells(cells, inputs)
+
+        self._new_grid = self._begin_update()
+        self._step = StepContext(self.state.free, self.config, self.halo)
+        arbiter = self._herb_arbiter
+        for cell, (i, j), move_number in zip(cells, positions, moves):
+            cell.apply_move(move_number)
+            arbiter.cell_move(cell, (j, i), self.grid, self._new_grid, self._step)
+
+        requests = []
+        for kind, coordinates, targets, cell in self._step.deferred:
+            self._deferred[coordinates] = (kind, cell)
+            # для укуса соседу нужна только цель, клетка передается при шаге и делении
+            requests.append((kind, coordinates, targets, None if kind == BITE else cell))
+        return requests
+
+    def resolve(self, requests: List[Request]) -> List[Response]:
+        """Метод разрешает запросы соседних тайлов к ячейкам этого тайла.
+
+        Args:
+            requests (List[Request]): Запросы соседей
+
+        Returns:
+            List[Response]: Ответы на запросы.
+        """
+        step = self._step
+        responses = []
+        for kind, (x, y), targets, cell in sorted(requests, key=lambda request: request[1][::-1]):
+            accepted = False
+            for i, j in targets:
+                if kind == BITE:
+                    target = self.grid[j][i]
+                    if isinstance(target, PlantFood) and self._new_grid[j][i] is target:
+                        self._new_grid[j][i] = EMPTY
+                        accepted = True
+                elif step.is_free(i, j):
+                    step.occupy(i, j)
+                    # при делении ребенка создает и о его рождении сообщает владелец ячейки, клетка тайла-соседа
+                    # отдаст ему половину здоровья, когда получит ответ
+                    cell.events = self.events
+                    self._new_grid[j][i] = cell if kind == MOVE else cell.reprodaction()
+                    accepted = True
+
+                if accepted:
+                    step.mark_dirty(i, j)
+                    break
+            responses.append(((x, y), accepted))
+        return responses
+
+    def commit(self, responses: List[Response]) -> Tuple[int, Dict[int, np.ndarray]]:
+        """Метод завершает шаг тайла.
+
+        Args:
+            responses (List[Response]): Ответы соседей на запросы этого тайла
+
+        Returns:
+            Tuple[int, Dict[int, np.ndarray]]: Число живых клеток тайла и веса ячеек его граничных строк.
+        """
+        step = self._step
+        for (x, y), accepted in responses:
+            kind, cell = self._deferred[(x, y)]
+            if not accepted:
+                continue
+            if kind == MOVE:
+                self._new_grid[y][x] = EMPTY
+                step.mark_dirty(x, y)
+            elif kind == BITE:
+                cell.got_food(self.config.food_energy)
+            else:
+                cell.share_health()
+
+        for i, j in step.dirty:
+            self.state.set_cell(i, j, self._new_grid[i][j])
+        self._pending |= step.dirty
+        # старая карта станет буфером и перед следующим шагом получит только изменившиеся ячейки
+        self._buffer, self.grid = self.grid, self._new_grid
+        self._stale = step.dirty
+        self._new_grid = self._step = None
+        self._deferred = {}
+
+        boundary = {row: self.state.costs[row].copy() for row in (self.start, self.stop - 1)}
+        return len(self.state.live), boundary
+
+    def paints(self) -> List[Tuple[int, int, str]]:
+        """Метод возвращает ячейки, изменившиеся с последней отрисовки.
+
+        Returns:
+            List[Tuple[int, int, str]]: Тройки (y, x, цвет).
+        """
+        paints = [(i, j, self.grid[i][j].get_color) for i, j in self._pending]
+        self._pending = set()
+        return paints
+
+    def grave_entries(self) -> List[Tuple[GraveKey, int]]:
+        """Метод возвращает ключи и кланы лучших умерших клеток тайла, от самой приспособленной."""
+        return [(key, cell.get_clan_name) for key, cell in self.grave.entries()]
+
+    def dead_cells(self, clans: List[int]) -> List[BaseLive]:
+        """Метод возвращает лучшие умершие клетки тайла переданных кланов."""
+        cells = {cell.get_clan_name: cell for _, cell in self.grave.entries()}
+        return [cells[clan] for clan in clans]
+
+
+def _serve_tile(conn, config: WorldConfig, start: int, stop: int) -> None:
+    """Функция процесса тайла: выполняет команды мира, пока не получит None."""
+    tile = Tile(config, start, stop)
+    while True:
+        message = conn.recv()
+        if message is None:
+            conn.close()
+            return
+        method, args = message
+        try:
+            result = getattr(tile, method)(*args)
+        except Exception as error:
+            # ошибка передается в процесс мира и выбрасывается там
+            result = error
+        conn.send(result)
+
+
+class _TileProcess:
+    """Тайл, который работает в отдельном процессе."""
+
+    def __init__(self, config: WorldConfig, start: int, stop: int):
+        self.start = start
+        self.stop = stop
+        self.halo = _halo_rows(config.rows, start, stop)
+        self._conn, child_conn = Pipe()
+        self._process = Process(target=_serve_tile, args=(child_conn, config, start, stop), daemon=True)
+        self._process.start()
+        child_conn.close()
+
+    def send(self, method: str, args: tuple) -> None:
+        self._conn.send((method, args))
+
+    def recv(self):
+        result = self._conn.recv()
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def close(self) -> None:
+        self._conn.send(None)
+        self._process.join()
+        self._conn.close()
+
+
+class _LocalTile:
+    """Тайл, который работает в процессе мира, используется для отладки и на машинах с одним ядром."""
+
+    def __init__(self, config: WorldConfig, start: int, stop: int):
+        self.start = start
+        self.stop = stop
+        self._tile = Tile(config, start, stop)
+        self.halo = self._tile.halo
+        self._result: bytes = None
+
+    def send(self, method: str, args: tuple) -> None:
+        # данные проходят через pickle так же, как между процессами, поэтому тайлы не делят между собой клетки
+        args = pickle.loads(pickle.dumps(args))
+        self._result = pickle.dumps(getattr(self._tile, method)(*args))
+
+    def recv(self):
+        return pickle.loads(self._result)
+
+    def close(self) -> None:
+        pass
+
+
+class TiledWorld:
+    """Класс мира, разбитого на горизонтальные тайлы, которые шагают параллельно в отдельных процессах.
+
+    Клетки каждого тайла живут в его процессе. Мир в основном процессе создает и заново заселяет карту в начале
+    каждой эпохи, раздает строки тайлам, пересылает между ними веса граничных строк и запросы на действия через
+    границу тайлов, и отрисовывает изменения. Один тайл дает тот же ход мира, что и World.
+    """
+
+    def __init__(self, renderer: Renderer, config: WorldConfig = None, tiles: int = 2, processes: bool = True):
+        """
+        Args:
+            renderer (Renderer): Отрисовщик мира
+            config (WorldConfig, optional): Параметры мира. Defaults to None.
+            tiles (int, optional): Число тайлов. Defaults to 2.
+            processes (bool, optional): True - каждый тайл работает в своем процессе, False - все тайлы работают в
+                процессе мира. Defaults to True.
+        """
+        self._renderer = renderer
+        self.world = World(renderer, config)
+        self.config = self.world.config
+        rows = self.config.rows
+        if tiles < 1:
+            raise ValueError("tiles должно быть не меньше 1")
+        # клетка у края тайла должна видеть строки не больше чем одного соседа
+        if tiles > 1 and rows // tiles < 2:
+            raise ValueError("в каждом тайле должно быть не меньше двух строк")
+
+        self._owners = np.empty(rows, dtype=np.intp)  # номер тайла для каждой строки мира
+        self._tiles = []
+        tile_class = _TileProcess if processes else _LocalTile
+        for index, part in enumerate(np.array_split(np.arange(rows), tiles)):
+            start, stop = int(part[0]), int(part[-1]) + 1
+            self._owners[start:stop] = index
+            self._tiles.append(tile_class(self.config, start, stop))
+
+        self._halos: Dict[int, np.ndarray] = {}  # веса ячеек граничных строк тайлов на начало шага
+        self._load()
+
+    @property
+    def epoch(self) -> int:
+        return self.world.epoch
+
+    @property
+    def step(self) -> int:
+        return self.world.step
+
+    @property
+    def total_steps(self) -> int:
+        return self.world.total_steps
+
+    @property
+    def history(self) -> List[Tuple[int, int]]:
+        return self.world.history
+
+    @property
+    def best_cells(self) -> List[Herbivore]:
+        return self.world.best_cells
+
+    def _call_all(self, method: str, args: List[tuple]) -> list:
+        """Метод вызывает метод всех тайлов параллельно и дожидается результатов.
+
+        Args:
+            method (str): Имя метода тайла
+            args (List[tuple]): Аргументы для каждого тайла
+
+        Returns:
+            list: Результаты тайлов в порядке тайлов.
+        """
+        for tile, tile_args in zip(self._tiles, args):
+            tile.send(method, tile_args)
+        return [tile.recv() for tile in self._tiles]
+
+    def _load(self) -> None:
+        """Метод раздает тайлам строки мира, созданного в основном процессе."""
+        grid = self.world.GRID
+        self._call_all("load", [({i: grid[i] for i in range(tile.start, tile.stop)},) for tile in self._tiles])
+        self._halos = {row: self.world.state.costs[row].copy() for tile in self._tiles for row in tile.halo}
+
+    def _make_step(self) -> None:
+        """Метод для совершения одной итерации мира."""
+        tiles = self._tiles
+        requests = self._call_all("act", [({row: self._halos[row] for row in tile.halo},) for tile in tiles])
+
+        incoming = [[] for _ in tiles]
+        for tile_requests in requests:
+            for request in tile_requests:
+                targets = request[2]
+                incoming[self._owners[targets[0][1]]].append(request)
+        responses = self._call_all("resolve", [(tile_requests,) for tile_requests in incoming])
+
+        outgoing = [[] for _ in tiles]
+        for tile_responses in responses:
+            for response in tile_responses:
+                (_, y), _ = response
+                outgoing[self._owners[y]].append(response)
+        reports = self._call_all("commit", [(tile_responses,) for tile_responses in outgoing])
+
+        live = 0
+        for count, boundary in reports:
+            live += count
+            self._halos.update(boundary)
+        self.world.population.update_population(live)
+
+        is_end_epoch = self.world.is_end_epoch()
+        if is_end_epoch:
+            self._reload()
+
+        self.world.step += 1
+        self.world.total_steps += 1
+
+    def _reload(self) -> None:
+        """Метод перезапускает мир в конце эпохи по лучшим умершим клеткам всех тайлов."""
+        # у каждого клана берется лучшая клетка среди всех тайлов, при равной приспособленности и номере смерти
+        # лучше клетка тайла с большим номером
+        best: Dict[int, Tuple[tuple, int]] = {}
+        for index, entries in enumerate(self._call_all("grave_entries", [()] * len(self._tiles))):
+            for (fitness, death), clan in entries:
+                key = (fitness, death, index)
+                if clan not in best or key > best[clan][0]:
+                    best[clan] = (key, index)
+        chosen = sorted(best.items(), key=lambda item: item[1][0], reverse=True)[: self.config.grave_size]
+
+        clans = [[] for _ in self._tiles]
+        for clan, (_, index) in chosen:
+            clans[index].append(clan)
+        cells = {}
+        for tile_clans, tile_cells in zip(clans, self._call_all("dead_cells", [(c,) for c in clans])):
+            cells.update(zip(tile_clans, tile_cells))
+
+        self.world.grave.restore([(key, cells[clan]) for clan, (key, _) in chosen], 0)
+        self.world.reload_world()
+        self._load()
+
+    def render(self) -> None:
+        """Метод отрисовывает все изменения мира, накопленные тайлами с последней отрисовки, и вспомогательный текст.
+
+        Ячейки отрисовываются только по данным тайлов, т.к. карта мира основного процесса обновляется лишь в начале
+        эпохи.
+        """
+        map_ids = self.world.state.map_ids
+        for paints in self._call_all("paints", [()] * len(self._tiles)):
+            for i, j, color in paints:
+                self._renderer.change_cell_color(int(map_ids[i, j]), color)
+
+        self._renderer.change_cells_count(self.world.population.total_count)
+        self._renderer.change_steps_count(self.step)
+        self._renderer.change_epoch_count(self.epoch)
+        self._renderer.update()
+
+    def execute(self, epochs: int = None, steps: int = None, cadence: RenderCadence = None) -> None:
+        """Метод запуска мира.
+
+        Args:
+            epochs (int, optional): Число эпох, после завершения которых мир остановится. Defaults to None.
+            steps (int, optional): Общее число шагов, после которых мир остановится. Defaults to None.
+            cadence (RenderCadence, optional): Частота отрисовки мира, по умолчанию каждый шаг. Defaults to None.
+        """
+        if cadence is None:
+            cadence = RenderCadence()
+
+        self.render()
+        while True:
+            epoch = self.epoch
+            self._make_step()
+
+            if cadence.should_render(self.epoch != epoch):
+                self.render()
+
+            if (epochs is not None and self.epoch > epochs) or (steps is not None and self.total_steps >= steps):
+                self.render()
+                return
+
+    def close(self) -> None:
+        """Метод останавливает процессы тайлов."""
+        for tile in self._tiles:
+            tile.close()
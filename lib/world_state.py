@@ -0,0 +1,93 @@
+from typing import List
+
+import numpy as np
+
+from cells import BaseCell
+from lib.index import Position, PositionIndex
+
+# смещения соседних ячеек (по строкам и по столбцам), начиная с левого верхнего угла и по часовой
+NEIGHBOURS_ROWS = np.array([-1, -1, -1, 0, 0, 1, 1, 1])
+NEIGHBOURS_COLS = np.array([-1, 0, 1, -1, 1, -1, 0, 1])
+
+
+class WorldState:
+    """Класс представляет мир в виде набора массивов NumPy (структура массивов).
+
+    Каждое свойство ячеек мира хранится в отдельном массиве размером с мир, это позволяет собирать входные значения
+    нейронной сети для всех живых клеток одной векторной операцией, вместо обхода соседей каждой клетки.
+
+    Помимо массивов ведутся индексы позиций живых клеток и свободных ячеек, они обновляются при каждом изменении
+    ячейки, поэтому поиск живых клеток стоит O(число живых клеток), а поиск свободного места O(1), а не O(размер мира).
+    """
+
+    def __init__(self, rows: int, cols: int):
+        self.types = np.full((rows, cols), -1, dtype=np.int8)  # коды типов ячеек, BaseCell.CODE
+        self.health = np.zeros((rows, cols), dtype=np.int32)  # здоровье живых клеток, для остальных ячеек 0
+        # id ячеек у отрисовщика, id определяется позицией и задается миром один раз при создании карты
+        self.map_ids = np.full((rows, cols), -1, dtype=np.int64)
+        self.costs = np.zeros((rows, cols), dtype=np.float64)  # стоимость ячеек для нейронной сети
+        self.live = PositionIndex()  # позиции (y, x) живых клеток
+        self.free = PositionIndex()  # позиции (y, x) свободных ячеек, в которые можно встать
+
+    def set_cell(self, i: int, j: int, cell: BaseCell) -> None:
+        """Метод переносит состояние ячейки в массивы.
+
+        Args:
+            i (int): Расположение ячейки по оси y
+            j (int): Расположение ячейки по оси x
+            cell (BaseCell): Ячейка, которая находится в данной позиции мира
+        """
+        self.types[i, j] = cell.CODE
+        self.costs[i, j] = cell.get_cost
+        # ячейка изменилась, значит в позиции родилась, пришла, ушла или умерла клетка
+        if cell.can_move:
+            self.health[i, j] = cell.get_health
+            self.live.add((i, j))
+        else:
+            self.health[i, j] = 0
+            self.live.discard((i, j))
+
+        if cell.is_solid:
+            self.free.discard((i, j))
+        else:
+            self.free.add((i, j))
+
+    def update_health(self, rows: np.ndarray, cols: np.ndarray, cells: List[BaseCell]) -> None:
+        """Метод обновляет здоровье переданных живых клеток.
+
+        Args:
+            rows (np.ndarray): Расположение клеток по оси y
+            cols (np.ndarray): Расположение клеток по оси x
+            cells (List[BaseCell]): Живые клетки, в том же порядке, что и координаты
+        """
+        self.health[rows, cols] = [cell.get_health for cell in cells]
+
+    def live_positions(self) -> List[Position]:
+        """Метод возвращает координаты всех живых клеток мира.
+
+        Returns:
+            List[Position]: Координаты (y, x) живых клеток, упорядоченные построчно.
+        """
+        return self.live.ordered()
+
+    def sense(self, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+        """Метод собирает входные значения нейронной сети для всех переданных клеток одной операцией.
+
+        Мир замкнут по кругу, поэтому соседи за границей мира берутся с другой его стороны.
+
+        Args:
+            rows (np.ndarray): Расположение клеток по оси y
+            cols (np.ndarray): Расположение клеток по оси x
+
+        Returns:
+            np.ndarray: Матрица (число клеток, 9), в каждой строке веса соседних ячеек, начиная с левого верхнего угла
+                и по часовой, и здоровье клетки деленное на 100.
+        """
+        height, width = self.types.shape
+        around_rows = (rows[:, None] + NEIGHBOURS_ROWS) % height
+        around_cols = (cols[:, None] + NEIGHBOURS_COLS) % width
+
+        inputs = np.empty((len(rows), len(NEIGHBOURS_ROWS) + 1), dtype=np.float64)
+        inputs[:, :-1] = self.costs[around_rows, around_cols]
+        inputs[:, -1] = self.health[rows, cols] / 100
+        return inputs
@@ -0,0 +1,53 @@
+from typing import List
+
+import numpy as np
+
+from neural.engine import NumpyEngine
+
+
+class BatchNeuralNetwork:
+    """Нейронная сеть, вычисляющая ходы сразу для всех клеток одним пакетным умножением матриц.
+
+    Веса всех клеток складываются в трехмерные тензоры, где первая ось - номер клетки, поэтому за шаг мира
+    производится одно умножение на каждый слой вместо отдельного маленького умножения на каждую клетку.
+    """
+
+    __slots__ = ("engine",)
+
+    def __init__(self, engine: NumpyEngine = None):
+        """
+        Args:
+            engine (NumpyEngine, optional): Движок вычисления, None - NumpyEngine. Defaults to None.
+        """
+        self.engine = engine if engine is not None else NumpyEngine()
+
+    def compute(self, hide_weights: np.ndarray, out_weights: np.ndarray, inputs: np.ndarray) -> np.ndarray:
+        """Метод производит вычисление предполагаемых ходов для всех клеток.
+
+        Args:
+            hide_weights (np.ndarray): Веса скрытого слоя всех клеток, размер (число клеток, входы, скрытый слой)
+            out_weights (np.ndarray): Веса выходного слоя всех клеток, размер (число клеток, скрытый слой, выходы)
+            inputs (np.ndarray): Входные значения всех клеток, размер (число клеток, входы)
+
+        Returns:
+            np.ndarray: Индексы самых ярких выходных нейронов каждой клетки, они определяют действия клеток.
+        """
+        return self.engine.decide_batch(hide_weights, out_weights, inputs)
+
+    def compute_cells(self, cells: list, inputs: np.ndarray) -> List[int]:
+        """Метод вычисляет действия переданных клеток по их геномам.
+
+        Используются веса сетей клеток, уже переведенные в float32.
+
+        Args:
+            cells (list): Живые клетки, совершающие ход
+            inputs (np.ndarray): Входные значения клеток, в том же порядке, что и клетки
+
+        Returns:
+            List[int]: Индексы действий клеток.
+        """
+        if not cells:
+            return []
+        hide_weights = np.stack([cell.neurons.hide_weights for cell in cells])
+        out_weights = np.stack([cell.neurons.out_weights for cell in cells])
+        return self.compute(hide_weights, out_weights, inputs).tolist()
@@ -0,0 +1,151 @@
+"""Движки вычисления нейронных сетей клеток.
+
+Веса генома один раз переводятся в непрерывные массивы float32 (prepare), после чего движок вычисляет ход одной
+клетки (decide) или сразу всех клеток (decide_batch). Сигмоида выходного слоя не вычисляется: она монотонна и не
+меняет самый яркий нейрон, кроме одного случая - для больших значений сигмоида исходной сети в float64 равна ровно
+1.0, и среди таких нейронов выигрывает первый. Поэтому выходы ограничиваются сверху значением SATURATION, что
+сохраняет этот выбор без вычисления экспонент.
+
+Доступные движки перечислены в ENGINES: numpy есть всегда, numba - только если пакет numba установлен.
+"""
+from typing import Dict, Type
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # pragma: no cover - numba необязательна
+    numba = None
+
+# начиная с этого значения сигмоида в float64 равна 1.0
+SATURATION = np.float32(36.75)
+
+
+def prepare(weights) -> np.ndarray:
+    """Функция переводит веса слоя в непрерывный массив float32, с которым работают движки.
+
+    Args:
+        weights: Веса слоя
+
+    Returns:
+        np.ndarray: Веса слоя в float32.
+    """
+    return np.ascontiguousarray(weights, dtype=np.float32)
+
+
+def _sigmoid(x: np.ndarray) -> np.ndarray:
+    # при больших отрицательных значениях exp переполняется в inf, что дает корректный 0
+    with np.errstate(over="ignore"):
+        return 1 / (1 + np.exp(-x))
+
+
+class NumpyEngine:
+    """Движок на векторных операциях NumPy."""
+
+    name = "numpy"
+
+    __slots__ = ()
+
+    def decide(self, hide_weights: np.ndarray, out_weights: np.ndarray, inputs) -> int:
+        """Метод вычисляет ход одной клетки.
+
+        Args:
+            hide_weights (np.ndarray): Веса скрытого слоя, размер (входы, скрытый слой)
+            out_weights (np.ndarray): Веса выходного слоя, размер (скрытый слой, выходы)
+            inputs: Входные значения клетки
+
+        Returns:
+            int: Индекс самого яркого выходного нейрона, он определяет действие.
+        """
+        hidden_outputs = _sigmoid(np.dot(np.asarray(inputs, dtype=np.float32), hide_weights))
+        out_input = np.minimum(np.dot(hidden_outputs, out_weights), SATURATION)
+        return int(np.argmax(out_input))
+
+    def decide_batch(self, hide_weights: np.ndarray, out_weights: np.ndarray, inputs: np.ndarray) -> np.ndarray:
+        """Метод вычисляет ходы всех клеток.
+
+        Args:
+            hide_weights (np.ndarray): Веса скрытого слоя всех клеток, размер (число клеток, входы, скрытый слой)
+            out_weights (np.ndarray): Веса выходного слоя всех клеток, размер (число клеток, скрытый слой, выходы)
+            inputs (np.ndarray): Входные значения всех клеток, размер (число клеток, входы)
+
+        Returns:
+            np.ndarray: Индексы самых ярких выходных нейронов каждой клетки.
+        """
+        inputs = np.asarray(inputs, dtype=np.float32)
+        hidden_outputs = _sigmoid(np.matmul(inputs[:, None, :], hide_weights))
+        out_input = np.minimum(np.matmul(hidden_outputs, out_weights), SATURATION)
+        return np.argmax(out_input[:, 0, :], axis=1)
+
+
+if numba is not None:
+
+    @numba.njit(cache=True)
+    def _decide_one(hide_weights, out_weights, inputs):  # pragma: no cover - требует numba
+        hidden = np.empty(hide_weights.shape[1], dtype=np.float32)
+        for k in range(hide_weights.shape[1]):
+            total = np.float32(0.0)
+            for i in range(hide_weights.shape[0]):
+                total += inputs[i] * hide_weights[i, k]
+            hidden[k] = np.float32(1.0) / (np.float32(1.0) + np.exp(-total))
+
+        best = 0
+        best_value = -np.inf
+        for o in range(out_weights.shape[1]):
+            total = np.float32(0.0)
+            for k in range(out_weights.shape[0]):
+                total += hidden[k] * out_weights[k, o]
+            if total > SATURATION:
+                total = SATURATION
+            if total > best_value:
+                best = o
+                best_value = total
+        return best
+
+    @numba.njit(cache=True)
+    def _decide_all(hide_weights, out_weights, inputs):  # pragma: no cover - требует numba
+        result = np.empty(inputs.shape[0], dtype=np.int64)
+        for c in range(inputs.shape[0]):
+            result[c] = _decide_one(hide_weights[c], out_weights[c], inputs[c])
+        return result
+
+
+class NumbaEngine(NumpyEngine):
+    """Движок на скомпилированных numba циклах, без промежуточных массивов.
+
+    Первый вызов компилирует функции, поэтому он заметно дольше остальных.
+    """
+
+    name = "numba"
+
+    __slots__ = ()
+
+    def decide(self, hide_weights: np.ndarray, out_weights: np.ndarray, inputs) -> int:
+        return int(_decide_one(hide_weights, out_weights, np.asarray(inputs, dtype=np.float32)))
+
+    def decide_batch(self, hide_weights: np.ndarray, out_weights: np.ndarray, inputs: np.ndarray) -> np.ndarray:
+        return _decide_all(hide_weights, out_weights, np.ascontiguousarray(inputs, dtype=np.float32))
+
+
+ENGINES: Dict[str, Type[NumpyEngine]] = {NumpyEngine.name: NumpyEngine}
+if numba is not None:
+    ENGINES[NumbaEngine.name] = NumbaEngine
+
+
+def get_engine(name: str = NumpyEngine.name) -> NumpyEngine:
+    """Функция возвращает движок вычисления по имени.
+
+    Args:
+        name (str, optional): Имя движка из ENGINES. Defaults to "numpy".
+
+    Raises:
+        ValueError: Движок неизвестен или для него не установлены зависимости.
+
+    Returns:
+        NumpyEngine: Движок вычисления.
+    """
+    if name == NumbaEngine.name and numba is None:
+        raise ValueError("движок numba требует установленного пакета numba")
+    if name not in ENGINES:
+        raise ValueError(f"неизвестный движок вычисления {name}, доступны: {', '.join(ENGINES)}")
+    return ENGINES[name]()
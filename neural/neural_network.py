@@ -1,15 +1,29 @@
-import math
+from neural.engine import NumpyEngine, prepare
 
-import numpy as np
+_DEFAULT_ENGINE = NumpyEngine()
 
 
 class NeuralNetwork:
+    """Нейронная сеть одной клетки.
 
-    __slots__ = ("hide_weights", "out_weights")
+    Веса переводятся в float32 один раз при создании сети, вычисление выполняет движок из neural.engine. Сеть
+    принадлежит геному, который может переходить между мирами, поэтому по умолчанию используется движок numpy, а не
+    движок из WorldConfig.inference. Мир вычисляет ходы всех клеток пакетно через neural.batch.BatchNeuralNetwork,
+    и параметр inference выбирает движок только для этого пути.
+    """
 
-    def __init__(self, hide_weights, out_weights):
-        self.hide_weights = np.matrix(hide_weights)
-        self.out_weights = np.matrix(out_weights)
+    __slots__ = ("hide_weights", "out_weights", "engine")
+
+    def __init__(self, hide_weights, out_weights, engine: NumpyEngine = _DEFAULT_ENGINE):
+        """
+        Args:
+            hide_weights: Веса скрытого слоя
+            out_weights: Веса выходного слоя
+            engine (NumpyEngine, optional): Движок вычисления. Defaults to NumpyEngine.
+        """
+        self.hide_weights = prepare(hide_weights)
+        self.out_weights = prepare(out_weights)
+        self.engine = engine
 
     def compute(self, inputs: list) -> int:
         """На основании переданных ранее весов производится вычисление предполагаемого хода.
@@ -20,16 +34,4 @@ class NeuralNetwork:
         Returns:
             int: Индекс самого яркого выходного нейрона, он определяет действие
         """
-        inputs_m = np.matrix(inputs)
-        vectorized_sigmoid = np.vectorize(self._sigmoid)
-
-        # вычисления нейронной сети
-        hidden_inputs = np.dot(inputs_m, self.hide_weights)
-        hidden_outputs = vectorized_sigmoid(hidden_inputs)
-        out_input = np.dot(hidden_outputs, self.out_weights)
-        result = vectorized_sigmoid(out_input)
-        return np.argmax(result.getA()[0])
-
-    @staticmethod
-    def _sigmoid(x):
-        return 1 / (1 + math.exp(-x))
+        return self.engine.decide(self.hide_weights, self.out_weights, inputs)
@@ -0,0 +1,3 @@
+from .base import Renderer
+from .headless import HeadlessRenderer
+from .cadence import RenderCadence
@@ -0,0 +1,78 @@
+from abc import ABC, abstractmethod
+
+import settings
+
+
+class Renderer(ABC):
+    """Общий интерфейс отрисовщика, через который мир сообщает о своем состоянии.
+
+    Мир ничего не знает о том, как именно отображаются клетки, он только сообщает какие ячейки поменяли цвет и
+    какие значения вспомогательного текста нужно показать.
+    """
+
+    @abstractmethod
+    def create_rectangle(self, x1: int, y1: int, x2: int, y2: int, fill: str = settings.EMPTY) -> int:
+        """Метод для генерации прямоугольника ячейки.
+
+        Args:
+            x1 (int): Координате левого верхнего угла по x
+            y1 (int): Координата левого верхнего угла по y
+            x2 (int): Координата нижнего правого угла по x
+            y2 (int): Координата нижнего правого угла по y
+            fill (str, optional): Цвет, которым будет залит прямоугольник. Defaults to settings.EMPTY.
+
+        Returns:
+            int: Будет возвращен id, под которым создан элемент.
+        """
+        pass
+
+    @abstractmethod
+    def change_cell_color(self, cell_id: int, fill: str) -> None:
+        """Метод для изменения цвета ячейки.
+
+        Args:
+            cell_id (int): id ячейки, полученный из create_rectangle
+            fill (str): Новый цвет ячейки
+        """
+        pass
+
+    @abstractmethod
+    def update(self) -> None:
+        """Метод для применения всех накопленных изменений."""
+        pass
+
+    @abstractmethod
+    def change_cells_count(self, count: int) -> None:
+        """Метод для отображения количества живых клеток в мире.
+
+        Args:
+            count (int): Число живых клеток.
+        """
+        pass
+
+    @abstractmethod
+    def change_steps_count(self, count: int) -> None:
+        """Метод для отображения числа шагов в текущей эпохе.
+
+        Args:
+            count (int): Число шагов в эпохе
+        """
+        pass
+
+    @abstractmethod
+    def change_epoch_count(self, count: int) -> None:
+        """Метод для отображения текущей эпохи.
+
+        Args:
+            count (int): Номер эпохи
+        """
+        pass
+
+    @abstractmethod
+    def change_past_steps_count(self, count: int) -> None:
+        """Метод для отображения количества шагов в предыдущей эпохе.
+
+        Args:
+            count (int): Число шагов в предыдущей эпохе.
+        """
+        pass
@@ -0,0 +1,50 @@
+import time
+
+
+class RenderCadence:
+    """Класс определяет, на каких шагах мира нужно производить отрисовку.
+
+    Симуляция не ждет отрисовку: мир делает шаги с полной скоростью, а изменения между кадрами накапливаются и
+    отрисовываются разом, когда наступает время следующего кадра.
+    """
+
+    def __init__(self, every: int = 1, fps: float = None, epochs_only: bool = False):
+        """
+        Args:
+            every (int, optional): Отрисовывать каждый N-ый шаг. Defaults to 1.
+            fps (float, optional): Максимальное число кадров в секунду, None - без ограничения. Defaults to None.
+            epochs_only (bool, optional): Отрисовывать только на границах эпох. Defaults to False.
+        """
+        if every < 1:
+            raise ValueError("every должно быть не меньше 1")
+        if fps is not None and fps <= 0:
+            raise ValueError("fps должно быть больше 0")
+
+        self._every = every
+        self._min_interval = 1 / fps if fps is not None else 0.0
+        self._epochs_only = epochs_only
+        self._steps = 0
+        self._last_frame = float("-inf")
+
+    def should_render(self, epoch_changed: bool = False) -> bool:
+        """Метод вызывается после каждого шага мира и сообщает, нужно ли отрисовать кадр.
+
+        Args:
+            epoch_changed (bool, optional): True если на этом шаге началась новая эпоха. Defaults to False.
+
+        Returns:
+            bool: True - если нужно отрисовать кадр.
+        """
+        self._steps += 1
+        if self._epochs_only:
+            return epoch_changed
+        if self._steps < self._every:
+            return False
+
+        now = time.monotonic()
+        if now - self._last_frame < self._min_interval:
+            return False
+
+        self._steps = 0
+        self._last_frame = now
+        return True
@@ -0,0 +1,40 @@
+import settings
+
+from render.base import Renderer
+
+
+class HeadlessRenderer(Renderer):
+    """Отрисовщик без окна, позволяет прогонять мир на серверах без дисплея с полной скоростью.
+
+    Ячейки не отрисовываются, отрисовщик только выдает уникальные id для ячеек и, при необходимости, печатает
+    итоги каждой эпохи.
+    """
+
+    def __init__(self, verbose: bool = False):
+        self._verbose = verbose
+        self._last_id = 0
+        self._epoch = 1
+
+    def create_rectangle(self, x1: int, y1: int, x2: int, y2: int, fill: str = settings.EMPTY) -> int:
+        self._last_id += 1
+        return self._last_id
+
+    def change_cell_color(self, cell_id: int, fill: str) -> None:
+        pass
+
+    def update(self) -> None:
+        pass
+
+    def change_cells_count(self, count: int) -> None:
+        pass
+
+    def change_steps_count(self, count: int) -> None:
+        pass
+
+    def change_epoch_count(self, count: int) -> None:
+        self._epoch = count
+
+    def change_past_steps_count(self, count: int) -> None:
+        # вызывается в конце эпохи, до того как номер эпохи будет увеличен
+        if self._verbose:
+            print(f"Epoch: {self._epoch}, steps: {count}")
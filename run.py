@@ -1,7 +1,168 @@
-from window import Window, World
+import argparse
+import random
+
+import numpy as np
+
+from lib.archive import GenomeArchive
+from lib.checkpoint import CheckpointWriter, load_checkpoint
+from lib.islands import IslandModel
+from lib.profiler import StepProfiler
+from lib.replay import ReplayPlayer, ReplayRecorder
+from lib.sweep import ParameterSweep, parse_grid
+from lib.tiles import TiledWorld
+from render import HeadlessRenderer, RenderCadence
+from world import World
+
+
+def parse_args() -> argparse.Namespace:
+    """Функция для разбора аргументов командной строки."""
+    parser = argparse.ArgumentParser(description="Симулятор эволюции клеток")
+    parser.add_argument("--headless", action="store_true", help="запуск без окна, с максимальной скоростью")
+    parser.add_argument("--epochs", type=int, default=None, help="число эпох, после которых симуляция остановится")
+    parser.add_argument("--steps", type=int, default=None, help="общее число шагов до остановки симуляции")
+    parser.add_argument("--seed", type=int, default=None, help="зерно генератора случайных чисел")
+    parser.add_argument("--render-every", type=int, default=1, help="отрисовывать окно каждые N шагов")
+    parser.add_argument("--fps", type=float, default=None, help="максимальное число кадров в секунду")
+    parser.add_argument("--render-epochs", action="store_true", help="отрисовывать окно только на границах эпох")
+    parser.add_argument("--checkpoint-dir", default=None, help="каталог для контрольных точек")
+    parser.add_argument("--checkpoint-every", type=int, default=1, help="записывать контрольную точку каждые N эпох")
+    parser.add_argument("--resume", default=None, help="продолжить симуляцию из файла контрольной точки")
+    parser.add_argument("--record", default=None, help="записывать ход симуляции в файл для просмотра")
+    parser.add_argument("--keyframe-every", type=int, default=500, help="число шагов между ключевыми кадрами записи")
+    parser.add_argument("--replay", default=None, help="проиграть запись симуляции вместо запуска мира")
+    parser.add_argument("--replay-epoch", type=int, default=None, help="эпоха, с которой начинается проигрывание")
+    parser.add_argument("--islands", type=int, default=None, help="запуск N островов без окна в пуле процессов")
+    parser.add_argument("--migrate-every", type=int, default=5, help="число эпох между миграциями островов")
+    parser.add_argument("--processes", type=int, default=None, help="число процессов пула островов и сетки")
+    parser.add_argument("--profile", type=int, default=None, help="печатать время фаз шага каждые N шагов")
+    parser.add_argument("--archive", default=None, help="сохранять лучшие геномы каждой эпохи в базу SQLite")
+    parser.add_argument("--warm-start", action="store_true", help="начать эволюцию с лучших геномов из --archive")
+    parser.add_argument("--tiles", type=int, default=None, help="разбить мир на N тайлов, шагающих в своих процессах")
+    parser.add_argument(
+        "--sweep", nargs="+", default=None, help="прогнать сетку параметров мира вида ИМЯ=ЗНАЧЕНИЕ,ЗНАЧЕНИЕ без окна"
+    )
+    parser.add_argument("--sweep-seeds", nargs="+", type=int, default=[0], help="зерна каждой точки сетки")
+    parser.add_argument("--sweep-output", default="sweep.csv", help="файл CSV для итогов прогонов сетки")
+    return parser.parse_args()
+
+
+def run_islands(args: argparse.Namespace) -> None:
+    """Функция запускает эволюцию по модели островов и печатает итоги каждой эпохи."""
+    if args.epochs is None:
+        raise SystemExit("для запуска островов нужно указать --epochs")
+
+    model = IslandModel(args.islands, args.migrate_every, args.processes, args.seed)
+    for result in model.run(args.epochs):
+        steps = ", ".join(str(count) for count in result["steps"])
+        print(
+            f"Epoch: {result['epoch']}, steps: [{steps}], mean: {result['mean_steps']:.1f}, max: {result['max_steps']}"
+        )
+
+
+def run_sweep(args: argparse.Namespace) -> None:
+    """Функция прогоняет сетку параметров мира и печатает итог каждого прогона по мере завершения."""
+    try:
+        sweep = ParameterSweep(parse_grid(args.sweep), args.sweep_seeds, args.epochs, args.steps, args.processes)
+    except (TypeError, ValueError) as error:
+        raise SystemExit(f"неверная сетка параметров: {error}")
+
+    print(f"Runs: {len(sweep.tasks())}, output: {args.sweep_output}")
+    for result in sweep.run_to_csv(args.sweep_output):
+        params = ", ".join(f"{name}={result[name]}" for name in sweep.grid)
+        if "error" in result:
+            print(f"Run {result['run']} ({params}, seed={result['seed']}): {result['error']}")
+            continue
+        print(
+            f"Run {result['run']} ({params}, seed={result['seed']}): epochs: {result['epochs']}, "
+            f"mean steps: {result['mean_steps']:.1f}, best lifetime: {result['best_lifetime']}"
+        )
+
+
+def run_tiles(args: argparse.Namespace, renderer, cadence: RenderCadence) -> None:
+    """Функция запускает мир, разбитый на тайлы."""
+    if args.resume or args.checkpoint_dir or args.record or args.profile or args.archive:
+        raise SystemExit("мир из тайлов не поддерживает контрольные точки, запись, профилирование и архив геномов")
+
+    world = TiledWorld(renderer, tiles=args.tiles)
+    try:
+        world.execute(epochs=args.epochs, steps=args.steps, cadence=cadence)
+    finally:
+        world.close()
+
+
+def main() -> None:
+    args = parse_args()
+
+    if args.islands is not None:
+        run_islands(args)
+        return
+
+    if args.sweep is not None:
+        run_sweep(args)
+        return
+
+    if args.seed is not None:
+        random.seed(args.seed)
+        np.random.seed(args.seed)
+
+    if args.headless:
+        renderer = HeadlessRenderer(verbose=True)
+    else:
+        # Tk импортируется только когда нужно окно, чтобы на серверах без дисплея хватало numpy
+        from window import Window
+
+        renderer = Window()
+
+    cadence = RenderCadence(every=args.render_every, fps=args.fps, epochs_only=args.render_epochs)
+
+    if args.replay is not None:
+        player = ReplayPlayer(args.replay)
+        start = player.find(args.replay_epoch) if args.replay_epoch is not None else 0
+        player.play(renderer, start=start, cadence=cadence)
+        return
+
+    if args.tiles is not None:
+        run_tiles(args, renderer, cadence)
+        return
+
+    if args.resume is not None:
+        world = load_checkpoint(args.resume, renderer)
+    else:
+        world = World(renderer)
+
+    if args.profile is not None:
+        world.profiler = StepProfiler(summary_every=args.profile)
+
+    archive = None
+    if args.archive is not None:
+        archive = GenomeArchive(args.archive)
+        if args.warm_start:
+            best_cells = archive.best_cells()
+            if len(best_cells) < 2:
+                raise SystemExit("для старта из архива в нем должны быть геномы хотя бы двух кланов")
+            world.seed_generation(best_cells)
+        world.add_epoch_sub(archive)
+
+    writer = None
+    if args.checkpoint_dir is not None:
+        writer = CheckpointWriter(args.checkpoint_dir, args.checkpoint_every)
+        world.add_epoch_sub(writer)
+
+    recorder = None
+    if args.record is not None:
+        recorder = ReplayRecorder(args.record, args.keyframe_every)
+        recorder.attach(world)
+
+    try:
+        world.execute(epochs=args.epochs, steps=args.steps, cadence=cadence)
+    finally:
+        if writer is not None:
+            writer.close()
+        if recorder is not None:
+            recorder.close()
+        if archive is not None:
+            archive.close()
 
 
 if __name__ == "__main__":
-    window = Window()
-    world = World(window)
-    world.execute()
+    main()
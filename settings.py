@@ -12,6 +12,9 @@ PLANT_FOOD = 'green'
 
 CELLS_POPULATION = 64
 
+PLANT_FOOD_COUNT = 150  # число клеток растительной пищи при создании мира
+PLANT_FOOD_REFILL = 175  # число клеток растительной пищи в начале каждой следующей эпохи
+
 BEST = '#8b00ff'
 SECOND = '#ff7f50'
 CHILDREN = '#de0c62'
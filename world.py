@@ -0,0 +1,459 @@
+import itertools
+import time
+from typing import Callable, List, Sequence, Set, Tuple
+
+import numpy as np
+
+import settings
+from action import BULK_MIN_CELLS, BulkArbiter, HerbArbiter, StepContext
+from cells import EMPTY, WALL, BaseCell, PlantFood
+from cells.genome import Genome
+from cells.live.clans import CROSSING, CROSSING_MUTATION, IMPORTED, MUTATION, RANDOM, ClanRegistry
+from cells.live.events import LifeEvents
+from cells.live.herbivore import Herbivore
+from cells.reproduction import Reprodaction
+from lib.config import WorldConfig
+from lib.population import FITNESS, Grave, Population
+from lib.profiler import StepProfiler
+from lib.world_state import WorldState
+from neural.batch import BatchNeuralNetwork
+from neural.engine import get_engine
+from render import RenderCadence, Renderer
+
+
+class World:
+    """Класс Реализация для управления миром, в котором существуют клетки."""
+
+    def __init__(self, renderer: Renderer, config: WorldConfig = None):
+        """
+        Args:
+            renderer (Renderer): Отрисовщик мира
+            config (WorldConfig, optional): Параметры мира, по умолчанию берутся из settings. Defaults to None.
+        """
+        self._renderer = renderer
+        self.config = config if config is not None else WorldConfig()
+        # мир хранится в двух заранее выделенных матрицах, которые меняются ролями каждый шаг: GRID содержит текущее
+        # состояние мира, а в буфер записывается следующее. клетки переносятся между матрицами по ссылке
+        self.GRID = self._make_board()
+        self._buffer = self._make_board()
+        # координаты ячеек, в которых буфер отстает от текущего состояния мира, None - буфер нужно синхронизировать
+        # полностью
+        self._stale: Set[Tuple[int, int]] = None
+        # координаты (y, x) ячеек, изменившихся с последней отрисовки
+        self._pending: Set[Tuple[int, int]] = set()
+        # представление текущего состояния мира массивами, используется для сбора входных значений нейронных сетей
+        self.state = WorldState(self.config.rows, self.config.cols)
+        self.population = Population(self.config.population)
+        if self.config.fitness not in FITNESS:
+            raise ValueError(f"неизвестная функция приспособленности: {self.config.fitness}")
+        self.grave = Grave(self.config.grave_size, FITNESS[self.config.fitness])
+        self.reproduction = Reprodaction(self.config.mutation_rate)
+        self.clans = ClanRegistry()  # реестр кланов мира с их родословной
+        self.epoch = 1
+        self.step = 1
+        self.total_steps = 0  # число шагов, сделанных миром за все эпохи
+        self.history: List[Tuple[int, int]] = []  # пары (эпоха, число шагов в ней) для всех завершенных эпох
+        self.best_cells: List[Herbivore] = []  # две лучшие клетки последней завершенной эпохи
+        self._epoch_subscribers = []  # подписчики на событие завершения эпохи
+        self._step_subscribers = []  # подписчики на событие завершения шага
+        # координаты (y, x) ячеек, изменившихся за текущий шаг, ведутся только если есть подписчики на шаги
+        self._step_changes: Set[Tuple[int, int]] = set()
+        self.profiler: StepProfiler = None  # профилировщик шагов мира, None - профилирование выключено
+
+        # производим подписку на события травоядных клеток этого мира
+        self.events = LifeEvents()
+        self.events.add_born_sub(self.population)
+        self.events.add_death_sub(self.population)
+        self.events.add_death_sub(self.grave)
+
+        self._neurons = BatchNeuralNetwork(get_engine(self.config.inference))
+        self._herb_arbiter = HerbArbiter()
+        self._bulk_arbiter = BulkArbiter() if self.config.bulk_arbiter is not False else None
+
+        self._generate_map()
+        self._generate_walls()
+        self._set_cells(PlantFood, self.config.plant_food_count)
+        self._set_herbivores(self.config.population)
+        self.population.update_population(len(self.state.live))
+
+    def _make_board(self) -> List[List[BaseCell]]:
+        """Метод создает пустую матрицу мира, представление мира в виде матрицы."""
+        return [[None] * self.config.cols for _ in range(self.config.rows)]
+
+    def _begin_update(self) -> List[List[BaseCell]]:
+        """Метод подготавливает буфер для записи следующего состояния мира.
+
+        Буфер синхронизируется с текущим состоянием мира копированием ссылок на клетки, сами клетки не копируются.
+        Копируются только ячейки, изменившиеся с прошлой синхронизации.
+
+        Returns:
+            List[List[BaseCell]]: Матрица в которую нужно записывать новое состояние мира.
+        """
+        if self._stale is None:
+            for i, row in enumerate(self.GRID):
+                self._buffer[i][:] = row
+        else:
+            for i, j in self._stale:
+                self._buffer[i][j] = self.GRID[i][j]
+        self._stale = set()
+        return self._buffer
+
+    def _generate_map(self):
+        """Метод вызывается для первичной генерации мира, заполняет его пустыми клетками."""
+        y1 = 0
+        y2 = settings.CELL_Y
+        for i, row in enumerate(self.GRID):
+            x1 = 0
+            x2 = settings.CELL_X
+            for j, _ in enumerate(row):
+                self.GRID[i][j] = EMPTY
+                self.state.map_ids[i, j] = self._renderer.create_rectangle(x1, y1, x2, y2)
+                self.state.set_cell(i, j, EMPTY)
+                x1 += settings.CELL_X
+                x2 += settings.CELL_X
+            y1 += settings.CELL_Y
+            y2 += settings.CELL_Y
+
+    def _generate_walls(self):
+        """Метод для первичного вызова, генерирует в пустом мире стены, за пределы которого клетки не могут выйти."""
+        new_grid = self._begin_update()
+        step = StepContext()
+        first_row = new_grid[0]
+        last_row = new_grid[-1]
+
+        def _fill_row(cell: BaseCell, row: List[BaseCell], row_index: int) -> None:
+            for i in range(len(row)):
+                new_grid[row_index][i] = cell
+                step.mark_dirty(i, row_index)
+
+        _fill_row(WALL, first_row, 0)
+        _fill_row(WALL, last_row, len(new_grid) - 1)
+
+        self._update_world(new_grid, step.dirty)
+
+    def _remove_all_cells(self):
+        """Метод приводит мир к чистому состоянию."""
+        new_grid = self._begin_update()
+        step = StepContext()
+
+        for i, row in enumerate(new_grid):
+            for j in range(len(row)):
+                new_grid[i][j] = EMPTY
+                step.mark_dirty(j, i)
+
+        # индексы строятся заново, чтобы порядок свободных ячеек, по которому выбираются места для новых клеток, не
+        # зависел от хода прошлой эпохи
+        self.state.live.clear()
+        self.state.free.clear()
+        self._update_world(new_grid, step.dirty)
+
+    def _set_cells(self, make_cell: Callable[[], BaseCell], count: int) -> None:
+        """Метод генерирует определенное количество клеток в мире в рандомные, пустых местах.
+
+        Args:
+            make_cell (Callable[[], BaseCell]): класс ячейки или функция, создающая ячейки которыми будет заполняться
+                мир
+            count (int): количество ячеек, которыми нужно заполнить мир
+        """
+        new_grid = self._begin_update()
+        step = StepContext()
+
+        # места выбираются равномерно из индекса свободных ячеек, если места на всех не хватает, заполняется все
+        # свободное место
+        free = self.state.free
+        for i, j in free.sample(min(count, len(free))):
+            new_grid[i][j] = make_cell()
+            step.mark_dirty(j, i)
+
+        self._update_world(new_grid, step.dirty)
+
+    def _set_herbivores(self, count: int, origin: int = RANDOM, parents: Sequence[int] = (), **kwargs) -> None:
+        """Метод расселяет в мире травоядные клетки, созданные по параметрам мира.
+
+        Клан и геном соответствуют друг другу один к одному. Если клан не передан, а передан общий объект Genome, все
+        клетки получают один новый клан из реестра кланов мира. Клетки со случайными геномами получают каждая свой
+        новый клан.
+
+        Args:
+            count (int): количество клеток, которыми нужно заполнить мир
+            origin (int, optional): происхождение новых кланов. Defaults to RANDOM.
+            parents (Sequence[int], optional): родительские кланы новых кланов. Defaults to ().
+            kwargs: параметры клеток, например геном, клан и цвет
+        """
+        kwargs.setdefault("health", self.config.start_health)
+        clan = kwargs.pop("clan", None)
+        # кланы регистрируются до расселения: один на группу с общим геномом или по одному на каждую клетку, которой
+        # хватит места, чтобы в реестре не было кланов без клеток
+        if clan is None and isinstance(kwargs.get("genome"), Genome):
+            clan = self.clans.register(self.epoch, origin, *parents)
+        if clan is not None:
+            clans = itertools.repeat(clan)
+        else:
+            placed = min(count, len(self.state.free))
+            clans = iter([self.clans.register(self.epoch, origin, *parents) for _ in range(placed)])
+
+        def make_cell() -> Herbivore:
+            return Herbivore(
+                clan=next(clans), events=self.events, hidden_neurons=self.config.hidden_neurons, **kwargs
+            )
+
+        self._set_cells(make_cell, count)
+
+    def _make_step(self):
+        """Метод для совершения одной итерации мира."""
+        # профилировщик проверяется перед каждой фазой, выключенный профилировщик не делает замеров времени
+        profiler = self.profiler
+        if profiler is not None:
+            started = profiler.start()
+
+        new_grid = self._begin_update()
+        step = StepContext(self.state.free, self.config)
+        if profiler is not None:
+            started = profiler.lap("copy", started)
+
+        positions = self.state.live_positions()
+        rows, cols = np.array(positions, dtype=np.intp).reshape(-1, 2).T
+        cells = [self.GRID[i][j] for i, j in positions]
+        # входные значения всех клеток собираются одной операцией по состоянию мира на начало шага
+        self.state.update_health(rows, cols, cells)
+        inputs = self.state.sense(rows, cols)
+        if profiler is not None:
+            started = profiler.lap("sensing", started)
+
+        # действия всех клеток вычисляются одним пакетным проходом нейронной сети
+        moves = self._neurons.compute_cells(cells, inputs)
+        if profiler is not None:
+            started = profiler.lap("inference", started)
+
+        if self._bulk_arbiter is not None and (self.config.bulk_arbiter or len(cells) >= BULK_MIN_CELLS):
+            # сперва все клетки делают действия, и затем арбитер разрешает их за один проход
+            for cell, move_number in zip(cells, moves):
+                cell.apply_move(move_number)
+            self._bulk_arbiter.resolve(cells, rows, cols, moves, new_grid, self.state, step)
+        else:
+            # в мире живут только травоядные клетки, поэтому арбитер выбирается один раз на шаг
+            arbiter = self._herb_arbiter
+            for cell, (i, j), move_number in zip(cells, positions, moves):
+                # сперва клетка делает действие и затем арбитер изменяет внешнее состояние мира
+                cell.apply_move(move_number)
+                arbiter.cell_move(cell, (j, i), self.GRID, new_grid, step)
+        if profiler is not None:
+            started = profiler.lap("arbitration", started)
+
+        epoch = self.epoch
+        is_end_epoch = self.is_end_epoch()
+        if is_end_epoch:
+            # записанное в буфер состояние отбрасывается, буфер нужно будет досинхронизировать и в этих ячейках
+            self._stale |= step.dirty
+            self.reload_world()
+        else:
+            self._update_world(new_grid, step.dirty)
+        if profiler is not None:
+            profiler.lap("update", started)
+            profiler.end_step(dict(step.counters(), cells=len(cells)), epoch, is_end_epoch)
+
+        self.step += 1
+        self.total_steps += 1
+
+        # подписчики вызываются, когда шаг полностью завершен и мир находится в согласованном состоянии
+        if self._step_subscribers:
+            changes, self._step_changes = self._step_changes, set()
+            for sub in self._step_subscribers:
+                sub.end_step(self, changes)
+        if is_end_epoch:
+            for sub in self._epoch_subscribers:
+                sub.end_epoch(self)
+
+    def add_epoch_sub(self, subscriber) -> None:
+        """Метод для добавления подписчика на событие завершения эпохи.
+
+        Args:
+            subscriber (object): Объект с методом end_epoch(world), который будет вызываться после каждой эпохи
+        """
+        self._epoch_subscribers.append(subscriber)
+
+    def add_step_sub(self, subscriber) -> None:
+        """Метод для добавления подписчика на событие завершения шага.
+
+        Args:
+            subscriber (object): Объект с методом end_step(world, changes), который будет вызываться после каждого
+                шага, changes - координаты (y, x) ячеек, изменившихся за шаг
+        """
+        self._step_subscribers.append(subscriber)
+
+    def restore_cells(self, cells: List[Tuple[int, int, BaseCell]]) -> None:
+        """Метод очищает мир и расставляет переданные ячейки на заданные места.
+
+        Используется для восстановления мира, например, из контрольной точки. Стены генерируются заново.
+
+        Args:
+            cells (List[Tuple[int, int, BaseCell]]): Тройки (y, x, ячейка)
+        """
+        self._remove_all_cells()
+        self._generate_walls()
+
+        new_grid = self._begin_update()
+        step = StepContext()
+        for i, j, cell in cells:
+            new_grid[i][j] = cell
+            step.mark_dirty(j, i)
+        self._update_world(new_grid, step.dirty)
+
+        self.population.update_population(len(self.state.live))
+
+    def render(self) -> None:
+        """Метод отрисовывает все изменения мира, накопленные с последней отрисовки, и вспомогательный текст."""
+        if self.profiler is not None:
+            started = time.perf_counter()
+
+        map_ids = self.state.map_ids
+        for i, j in self._pending:
+            self._renderer.change_cell_color(int(map_ids[i, j]), self.GRID[i][j].get_color)
+        self._pending = set()
+
+        self._renderer.change_cells_count(self.population.total_count)
+        self._renderer.change_steps_count(self.step)
+        self._renderer.change_epoch_count(self.epoch)
+        self._renderer.update()
+
+        if self.profiler is not None:
+            self.profiler.add("render", time.perf_counter() - started)
+
+    def is_end_epoch(self) -> bool:
+        """Метод проверяет, является ли данная итерация концом эпохи."""
+        return self.population.total_count == 0
+
+    def _clear_world(self) -> None:
+        """Метод для полной очистки мира."""
+        self._remove_all_cells()
+        self._generate_walls()
+        self._set_cells(PlantFood, self.config.plant_food_refill)
+
+    def _fill_new_generation(
+        self,
+        best_epoch_cells: list[Herbivore],
+        best_clans: Sequence[int],
+        children: Genome,
+        best_mutation: Genome,
+        second_mutation: Genome,
+        children_mutation: Genome,
+    ) -> None:
+        """Метод производит заполнение нового мира клетками с новым геномом.
+
+        Args:
+            best_epoch_cells (list): Массив содержащий в себе две лучшие клетки предыдущего поколения
+            best_clans (Sequence[int]): Кланы лучшей и второй лучшей клетки в реестре этого мира
+            children (Genome): Скрещенный геном двух лучших клеток предыдущего поколения
+            best_mutation (Genome): Измененный геном лучшей клетки предыдущего поколения
+            second_mutation (Genome): Измененный геном второй лучшей клетки предыдущего поколения
+            children_mutation (Genome): Измененный геном ребенка лучших клеток
+        """
+        best = best_epoch_cells[0]
+        second = best_epoch_cells[1]
+        best_clan, second_clan = best_clans
+        self._set_herbivores(8, genome=best.genome, clan=best_clan, color=settings.BEST)
+        self._set_herbivores(8, genome=second.genome, clan=second_clan, color=settings.SECOND)
+        self._set_herbivores(8, CROSSING, best_clans, genome=children, color=settings.CHILDREN)
+        self._set_herbivores(8, MUTATION, (best_clan,), genome=best_mutation)
+        self._set_herbivores(8, MUTATION, (second_clan,), genome=second_mutation)
+        self._set_herbivores(8, CROSSING_MUTATION, best_clans, genome=children_mutation)
+
+    def reload_world(self) -> None:
+        """Метод производит перезапуск мира, если был конец эпохи."""
+        self._renderer.change_past_steps_count(self.step)
+        self.history.append((self.epoch, self.step))
+        self.epoch += 1
+        self._renderer.change_epoch_count(self.epoch)
+        self.step = 0
+
+        self.best_cells = self.grave.get_best()
+        self.seed_generation(self.best_cells, imported=False)
+
+    def seed_generation(self, best_epoch_cells: List[Herbivore], imported: bool = True) -> None:
+        """Метод очищает мир и заселяет его новым поколением, полученным из двух лучших клеток.
+
+        Вызывается в конце каждой эпохи, а также может вызываться снаружи, чтобы начать эволюцию с уже известных
+        геномов, например, пришедших с другого острова.
+
+        Args:
+            best_epoch_cells (List[Herbivore]): Две лучшие клетки, лучшая идет первой
+            imported (bool, optional): Клетки пришли извне мира и их кланов нет в реестре кланов мира, тогда клетки
+                получают новые кланы с происхождением IMPORTED. Defaults to True.
+        """
+        if imported:
+            best_clans = [self.clans.register(self.epoch, IMPORTED) for _ in best_epoch_cells[:2]]
+        else:
+            best_clans = [cell.get_clan_name for cell in best_epoch_cells[:2]]
+        self._clear_world()
+
+        children_genome = self.reproduction.crossing(*best_epoch_cells)
+        # мутация создает новые массивы, поэтому общие геномы лучших клеток не копируются
+        best_genome = best_epoch_cells[0].genome.layers()
+        second_genome = best_epoch_cells[1].genome.layers()
+
+        best_mutated_genome = list()
+        second_mutated_genome = list()
+        mutated_children = list()
+        for genome in best_genome:
+            best_mutated_genome.append(self.reproduction.mutation(genome, self.config.mutation_delta))
+        for genome in second_genome:
+            second_mutated_genome.append(self.reproduction.mutation(genome, self.config.second_mutation_delta))
+        for genome in children_genome:
+            mutated_children.append(self.reproduction.mutation(genome, self.config.mutation_delta))
+
+        # каждый новый геном оборачивается в Genome один раз, и все клетки группы делят его веса и сеть
+        self._fill_new_generation(
+            best_epoch_cells,
+            best_clans,
+            Genome(*children_genome),
+            Genome(*best_mutated_genome),
+            Genome(*second_mutated_genome),
+            Genome(*mutated_children),
+        )
+        # обновлять популяцию нужно после того как мир был заново заселен клетками
+        self.grave.clear()
+        self.population.update_population(len(self.state.live))
+
+    def _update_world(self, new_world: List[List[BaseCell]], dirty: Set[Tuple[int, int]]):
+        """Метод производит обновление мира.
+
+        Ячейки, которые арбитер отметил как изменившиеся, переносятся в представление мира массивами и откладываются
+        до следующей отрисовки, после чего новое состояние мира становится текущим.
+
+        Args:
+            new_world (List[List[BaseCell]]): Матрица содержащая обновленное состояние мира, новое положение клеток.
+                Ожидается буфер, полученный из _begin_update.
+            dirty (Set[Tuple[int, int]]): Координаты (y, x) изменившихся ячеек
+        """
+        for i, j in dirty:
+            self.state.set_cell(i, j, new_world[i][j])
+        self._pending |= dirty
+        if self._step_subscribers:
+            self._step_changes |= dirty
+        # буферы меняются ролями, старое состояние станет буфером и будет синхронизировано перед следующей записью
+        self._buffer, self.GRID = self.GRID, new_world
+        self._stale = dirty
+
+    def execute(self, epochs: int = None, steps: int = None, cadence: RenderCadence = None) -> None:
+        """Метод запуска мира.
+
+        Args:
+            epochs (int, optional): Число эпох, после завершения которых мир остановится. Defaults to None.
+            steps (int, optional): Общее число шагов, после которых мир остановится. Defaults to None.
+            cadence (RenderCadence, optional): Частота отрисовки мира, по умолчанию каждый шаг. Defaults to None.
+        """
+        if cadence is None:
+            cadence = RenderCadence()
+
+        self.render()
+        while True:
+            epoch = self.epoch
+            self._make_step()
+
+            if cadence.should_render(self.epoch != epoch):
+                self.render()
+
+            if (epochs is not None and self.epoch > epochs) or (steps is not None and self.total_steps >= steps):
+                # последний кадр отрисовывается всегда, чтобы окно показывало итоговое состояние мира
+                self.render()
+                return